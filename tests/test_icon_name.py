@@ -0,0 +1,29 @@
+"""Tests for mapping NOAA icon URLs to local icon names"""
+
+from weatherstar_modules.displays import icon_name_for_url
+
+
+def test_single_condition():
+    assert icon_name_for_url("https://api.weather.gov/icons/land/day/few?size=medium") == 'Clear'
+    assert icon_name_for_url("https://api.weather.gov/icons/land/night/ovc?size=medium") == 'Cloudy'
+    assert icon_name_for_url("https://api.weather.gov/icons/land/day/rain_showers,30?size=medium") == 'Shower'
+
+
+def test_probability_suffix_is_stripped():
+    # Behavior change: the original parsing looked up "rain,60" as is and fell back to Clear
+    assert icon_name_for_url("https://api.weather.gov/icons/land/day/rain,60?size=medium") == 'Rain'
+
+
+def test_multi_condition_uses_last_condition():
+    assert icon_name_for_url("https://api.weather.gov/icons/land/day/tsra,40/rain,60?size=medium") == 'Rain'
+    assert icon_name_for_url("https://api.weather.gov/icons/land/day/rain,60/tsra,40?size=medium") == 'Thunderstorm'
+
+
+def test_unknown_or_malformed_falls_back_to_clear():
+    assert icon_name_for_url("https://api.weather.gov/icons/land/day/hurricane?size=medium") == 'Clear'
+    assert icon_name_for_url("https://api.weather.gov/icons/land/day/FEW?size=medium") == 'Clear'
+    assert icon_name_for_url("https://api.weather.gov/icons/land/day/") == 'Clear'
+
+
+def test_url_without_path_returns_none():
+    assert icon_name_for_url("few") is None
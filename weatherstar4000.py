@@ -5,12 +5,17 @@ WeatherStar 4000+ Python Implementation with Comprehensive Logging
 
 import pygame
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import re
 import time
 import os
 import sys
 import io
 from datetime import datetime, timedelta
+from functools import partial
+from email.utils import mktime_tz, parsedate_tz
 from pathlib import Path
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
@@ -19,6 +24,9 @@ import random
 import logging
 import webbrowser
 import threading
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import our custom modules
 from weatherstar_modules.weatherstar_logger import init_logger, get_logger
@@ -27,7 +35,7 @@ from weatherstar_modules import get_local_news
 from weatherstar_modules.animated_icons import AnimatedIconManager
 from weatherstar_modules.displays import WeatherStarDisplays
 from weatherstar_modules.news_displays import WeatherStarNewsDisplays
-from weatherstar_modules.data_fetchers import WeatherStarDataFetchers
+from weatherstar_modules.data_fetchers import WeatherStarDataFetchers, RADAR_FRAMES_EVENT
 
 # Initialize logging
 logger = init_logger()
@@ -53,9 +61,48 @@ except ImportError as e:
 SCREEN_WIDTH = 640
 SCREEN_HEIGHT = 480
 
+# Bottom band holding the scrolling text banner, repainted on its own for static screens
+SCROLLER_BAND = (0, 430, SCREEN_WIDTH, SCREEN_HEIGHT - 430)
+
 # Display timing (from ws4kp navigation.mjs)
 DISPLAY_DURATION_MS = 15000  # 15 seconds per screen (slowed down for better viewing)
 SCROLL_SPEED = 100  # pixels/second for bottom scroll
+DEFAULT_FPS = 15  # Frame cap; the scroller moves by elapsed time, so it keeps its speed
+MINIMIZED_WAIT_MS = 1000  # Longest idle block per frame while the window is minimized
+
+# Timer event that triggers the periodic weather refresh
+WEATHER_UPDATE_EVENT = pygame.USEREVENT + 1
+WEATHER_UPDATE_INTERVAL_MS = 5 * 60 * 1000
+
+# Posted by the mixer when a track finishes, to start the next one in the playlist
+MUSIC_END_EVENT = pygame.USEREVENT + 2
+
+# Carries rebuilt scroll text from the weather refresh thread to the main loop
+SCROLL_TEXT_EVENT = pygame.USEREVENT + 3
+
+# Freshness lifetime from a Cache-Control header
+MAX_AGE_RE = re.compile(r'\bmax-age=(\d+)')
+
+# NOAA responses kept between runs, so a restart can skip or revalidate its first requests
+API_CACHE_FILE = Path.home() / ".cache" / "weatherstar" / "api_cache.json"
+
+# Unit conversions for the scroller (NWS observations are metric)
+C_TO_F_SCALE = 1.8
+MS_TO_MPH = 2.237
+
+# 16-point compass names, clockwise from north in 22.5° steps
+WIND_DIRECTIONS = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+                   'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+
+# Settings menu toggle keys: key -> (setting, default, changes the screen rotation, log label)
+MENU_TOGGLES = {
+    pygame.K_1: ('show_marine', False, True, "Marine forecast"),
+    pygame.K_2: ('show_trends', True, False, "Weather trends"),
+    pygame.K_3: ('show_historical', True, False, "Historical data"),
+    pygame.K_5: ('show_msn', False, True, "MSN news"),
+    pygame.K_6: ('show_reddit', False, True, "Reddit news"),
+    pygame.K_7: ('show_local_news', True, True, "Local news"),
+}
 
 # Authentic ws4kp display modes
 class DisplayMode(Enum):
@@ -81,6 +128,47 @@ class DisplayMode(Enum):
     REDDIT_NEWS = "reddit-news"
     LOCAL_NEWS = "local-news"
 
+# Screens that change between frames on their own (scrolling lists, radar loop,
+# animated icons). All other screens are only redrawn when something marks them dirty
+ANIMATED_MODES = frozenset({
+    DisplayMode.CURRENT_CONDITIONS,
+    DisplayMode.EXTENDED_FORECAST,
+    DisplayMode.HOURLY_FORECAST,
+    DisplayMode.WEEKEND_FORECAST,
+    DisplayMode.AIR_QUALITY,
+    DisplayMode.RADAR,
+    DisplayMode.MSN_NEWS,
+    DisplayMode.REDDIT_NEWS,
+    DisplayMode.LOCAL_NEWS,
+})
+
+# Header titles for screens drawn by the fallback, e.g. "local-news" -> "Local News"
+DISPLAY_TITLES = {mode: mode.value.replace('-', ' ').title() for mode in DisplayMode}
+
+# NWS condition codes to icon files, built once instead of on every lookup
+ICON_MAP_DAY = {
+    'skc': 'Sunny.gif',
+    'few': 'Partly-Cloudy.gif',
+    'sct': 'Partly-Cloudy.gif',
+    'bkn': 'Cloudy.gif',
+    'ovc': 'Cloudy.gif',
+    'fog': 'Fog.gif',
+    'smoke': 'Smoke.gif',
+    'rain': 'Rain.gif',
+    'rain_showers': 'Shower.gif',
+    'tsra': 'Scattered-Thunderstorms-Day.gif',
+    'snow': 'Snow.gif',
+    'sleet': 'Sleet.gif',
+    'frzra': 'Freezing-Rain.gif',
+    'wind': 'Windy.gif',
+}
+ICON_MAP_NIGHT = dict(
+    ICON_MAP_DAY,
+    skc='Clear.gif',
+    few='Mostly-Clear.gif',
+    tsra='Scattered-Thunderstorms-Night.gif',
+)
+
 # Colors from ws4kp SCSS
 COLORS = {
     'yellow': (255, 255, 0),           # Title color
@@ -101,25 +189,9 @@ class WeatherIcon:
     @staticmethod
     def get_icon(condition_code, is_night=False):
         """Get icon filename for weather condition"""
-        icon_map = {
-            'skc': 'Clear.gif' if is_night else 'Sunny.gif',
-            'few': 'Mostly-Clear.gif' if is_night else 'Partly-Cloudy.gif',
-            'sct': 'Partly-Cloudy.gif',
-            'bkn': 'Cloudy.gif',
-            'ovc': 'Cloudy.gif',
-            'fog': 'Fog.gif',
-            'smoke': 'Smoke.gif',
-            'rain': 'Rain.gif',
-            'rain_showers': 'Shower.gif',
-            'tsra': 'Scattered-Thunderstorms-Day.gif' if not is_night else 'Scattered-Thunderstorms-Night.gif',
-            'snow': 'Snow.gif',
-            'sleet': 'Sleet.gif',
-            'frzra': 'Freezing-Rain.gif',
-            'wind': 'Windy.gif',
-        }
-
+        icon_map = ICON_MAP_NIGHT if is_night else ICON_MAP_DAY
         result = icon_map.get(condition_code, 'No-Data.gif')
-        logger.main_logger.debug(f"Icon mapping: {condition_code} -> {result}")
+        logger.main_logger.debug("Icon mapping: %s -> %s", condition_code, result)
         return result
 
 class ScrollingText:
@@ -130,17 +202,40 @@ class ScrollingText:
         self.text_items = []
         self.current_text = ""
         self.scroll_x = SCREEN_WIDTH
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
+        # Rendered current_text, re-rasterized only when the text changes
+        self._surface_text = None
+        self._surface = None
+        self._text_width = 0
+        # What the last draw() put on screen, so update() can report real changes
+        self._drawn = None
         logger.main_logger.debug("ScrollingText initialized")
 
     def add_item(self, text):
         """Add item to scroll"""
         self.text_items.append(text)
-        logger.main_logger.debug(f"Added scroll item: {text[:50]}...")
+        logger.main_logger.debug("Added scroll item: %.50s...", text)
+
+    def set_items(self, items):
+        """Replace the items to scroll; only called from the main thread"""
+        self.text_items = list(items)
+        if not self.current_text and self.text_items:
+            self.current_text = self.text_items[0]
+
+    def _refresh_surface(self):
+        """Render current_text if it changed since the last frame"""
+        if self.current_text != self._surface_text:
+            self._surface_text = self.current_text
+            self._surface = self.font.render(self.current_text, True, COLORS['white']).convert_alpha()
+            self._text_width = self._surface.get_width()
+
+    def _visible_state(self):
+        """Text and whole-pixel position as drawn (blit truncates the float x)"""
+        return (self.current_text, int(self.scroll_x) if self.current_text else 0)
 
     def update(self):
-        """Update scroll position"""
-        current_time = time.time()
+        """Update scroll position; returns whether the drawn banner would change"""
+        current_time = time.monotonic()
         dt = current_time - self.last_update
         self.last_update = current_time
 
@@ -148,29 +243,28 @@ class ScrollingText:
         self.scroll_x -= SCROLL_SPEED * dt
 
         # Reset when text goes off screen
-        text_width = self.font.size(self.current_text)[0]
-        if self.scroll_x < -text_width:
+        self._refresh_surface()
+        if self.scroll_x < -self._text_width:
             self.scroll_x = SCREEN_WIDTH
             # Cycle to next text item
             if self.text_items:
                 self.current_text = self.text_items[0]
                 self.text_items = self.text_items[1:] + [self.text_items[0]]
-                logger.main_logger.debug(f"Cycled to next scroll text: {self.current_text[:30]}...")
+                logger.main_logger.debug("Cycled to next scroll text: %.30s...", self.current_text)
+
+        return self._visible_state() != self._drawn
 
     def draw(self, screen, y_pos):
         """Draw scrolling text"""
         if self.current_text:
-            text_surface = self.font.render(self.current_text, True, COLORS['white'])
-            screen.blit(text_surface, (self.scroll_x, y_pos))
-
+            self._refresh_surface()
+            screen.blit(self._surface, (self.scroll_x, y_pos))
+        self._drawn = self._visible_state()
 
-def get_automatic_location():
-    """Try to automatically detect location using various methods"""
-    logger.main_logger.info("Attempting automatic location detection...")
 
-    # Method 1: Try IP geolocation using ipapi.co (free, no key required)
+def _locate_ipapi_co():
+    """IP geolocation using ipapi.co (free, no key required)"""
     try:
-        import requests
         response = requests.get('https://ipapi.co/json/', timeout=5)
         if response.status_code == 200:
             data = response.json()
@@ -182,12 +276,14 @@ def get_automatic_location():
 
             # Only use if it's in the US (NOAA only covers US)
             if country == 'US' and lat and lon:
-                logger.main_logger.info(f"Location detected: {city}, {region} ({lat}, {lon})")
                 return lat, lon, f"{city}, {region}"
     except Exception as e:
         logger.main_logger.debug(f"IP geolocation failed: {e}")
+    return None
+
 
-    # Method 2: Try alternative IP geolocation service
+def _locate_ip_api_com():
+    """Alternative IP geolocation using ip-api.com"""
     try:
         response = requests.get('http://ip-api.com/json/', timeout=5)
         if response.status_code == 200:
@@ -200,10 +296,30 @@ def get_automatic_location():
                 country = data.get('countryCode', '')
 
                 if country == 'US' and lat and lon:
-                    logger.main_logger.info(f"Location detected: {city}, {region} ({lat}, {lon})")
                     return lat, lon, f"{city}, {region}"
     except Exception as e:
         logger.main_logger.debug(f"Alternative IP geolocation failed: {e}")
+    return None
+
+
+def get_automatic_location():
+    """Try to automatically detect location using various methods"""
+    logger.main_logger.info("Attempting automatic location detection...")
+
+    # Ask both services at once and take the first usable answer, so a slow
+    # or unreachable provider no longer delays startup before the other is tried
+    executor = ThreadPoolExecutor(max_workers=2)
+    futures = [executor.submit(_locate_ipapi_co), executor.submit(_locate_ip_api_com)]
+    try:
+        for future in as_completed(futures):
+            result = future.result()
+            if result:
+                lat, lon, description = result
+                logger.main_logger.info(f"Location detected: {description} ({lat}, {lon})")
+                return result
+    finally:
+        # Don't wait for the slower lookup; its own timeout ends it
+        executor.shutdown(wait=False)
 
     # If all methods fail, return None
     logger.main_logger.info("Automatic location detection failed, using default")
@@ -216,42 +332,152 @@ class NOAAWeatherAPI:
     def __init__(self):
         self.base_url = "https://api.weather.gov"
         self.headers = {'User-Agent': 'WeatherStar4000Python/1.0'}
-        self.cache = {}
-        self.cache_time = {}
+
+        # One keep-alive session for every api.weather.gov call, retrying
+        # transient failures and rate limiting with a short backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retries))
+
+        # key -> (expiry timestamp, data, validators), least recently used first.
+        # Validators (ETag / Last-Modified) are sent back to revalidate expired entries
+        self._cache = OrderedDict()
+        self._max_entries = 256
+        self._cache_lock = threading.Lock()
         logger.api_logger.info("NOAA Weather API initialized")
 
-    def _is_cache_valid(self, key, max_age=300):
-        """Check if cached data is still valid"""
-        if key not in self.cache_time:
-            return False
-        age = time.time() - self.cache_time[key]
-        valid = age < max_age
-        if valid:
-            logger.api_logger.debug(f"Cache hit for {key} (age: {age:.1f}s)")
-        return valid
-
-    def _cache_data(self, key, data):
-        """Cache data with timestamp"""
-        self.cache[key] = data
-        self.cache_time[key] = time.time()
-        logger.api_logger.debug(f"Cached data for {key}")
+    def warm_up(self):
+        """Open the api.weather.gov connection in the background so the first request reuses it"""
+        def connect():
+            try:
+                self.session.head(self.base_url, timeout=3)
+                logger.api_logger.debug("API connection warmed up")
+            except requests.RequestException as e:
+                logger.api_logger.debug(f"API warm-up failed: {e}")
+
+        threading.Thread(target=connect, daemon=True).start()
+
+    def _get_cached(self, key):
+        """Return cached data still within its freshness lifetime, else None"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            remaining = entry[0] - time.monotonic()
+            if remaining <= 0:
+                return None
+            self._cache.move_to_end(key)
+        logger.api_logger.debug("Cache hit for %s (fresh for %.1fs)", key, remaining)
+        return entry[1]
+
+    def _cache_data(self, key, data, resp, default_ttl, validators=None):
+        """Cache data for as long as the response says it stays fresh"""
+        ttl = self._response_ttl(resp, default_ttl)
+
+        validators = dict(validators or {})
+        if resp.headers.get('ETag'):
+            validators['If-None-Match'] = resp.headers['ETag']
+        if resp.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = resp.headers['Last-Modified']
+
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, data, validators)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+        logger.api_logger.debug("Cached data for %s (%ss)", key, ttl)
+
+    def expire_cache(self):
+        """Mark every entry stale so the next requests go out, still sending their validators"""
+        with self._cache_lock:
+            for key, (_, data, validators) in self._cache.items():
+                self._cache[key] = (0, data, validators)
+
+    def load_cache(self, path):
+        """Restore responses saved by save_cache; expired ones are kept for revalidation"""
+        # Saved expiries are wall-clock times; the live cache counts on the monotonic clock
+        offset = time.monotonic() - time.time()
+        try:
+            with open(path, 'r') as f:
+                saved = json.load(f)
+            entries = [(key, (expires_at + offset, data, validators))
+                       for key, expires_at, data, validators in saved[-self._max_entries:]]
+        except FileNotFoundError:
+            return
+        except (OSError, TypeError, ValueError) as e:
+            logger.api_logger.warning(f"Could not read API cache {path}: {e}")
+            return
+
+        with self._cache_lock:
+            self._cache.update(entries)
+        logger.api_logger.info(f"Loaded {len(entries)} cached API responses")
+
+    def save_cache(self, path):
+        """Write the cache to disk, least recently used first"""
+        offset = time.time() - time.monotonic()
+        with self._cache_lock:
+            saved = [[key, expiry + offset, data, validators]
+                     for key, (expiry, data, validators) in self._cache.items()]
+        try:
+            # Replace the old file in one step so a crash never leaves it half written
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(saved, f)
+            os.replace(tmp_path, path)
+            logger.api_logger.info(f"Saved {len(saved)} cached API responses")
+        except OSError as e:
+            logger.api_logger.warning(f"Could not save API cache {path}: {e}")
+
+    def _response_ttl(self, resp, default_ttl):
+        """Seconds until resp goes stale per Cache-Control or Expires, else default_ttl"""
+        match = MAX_AGE_RE.search(resp.headers.get('Cache-Control', ''))
+        if match:
+            return int(match.group(1))
+
+        expires = resp.headers.get('Expires')
+        if expires:
+            try:
+                return max(0, int(mktime_tz(parsedate_tz(expires)) - time.time()))
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return default_ttl
+
+    def _stale_entry(self, key):
+        """Data and validators of an expired cache entry, captured before a conditional request"""
+        # Held by the caller because the entry can be evicted before a 304 comes back
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        return (entry[1], entry[2]) if entry else (None, None)
+
+    def _revalidated(self, key, data, validators, resp, default_ttl):
+        """Extend a cached entry the server answered 304 Not Modified for"""
+        # A 304 may omit the validators; start from the ones the entry was stored with
+        self._cache_data(key, data, resp, default_ttl, validators)
+        logger.api_logger.debug("%s not modified, keeping cached data", key)
+        return data
 
     def get_point_data(self, lat, lon):
         """Get weather grid point data"""
         cache_key = f"point_{lat}_{lon}"
 
-        if self._is_cache_valid(cache_key, 3600):
-            return self.cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        stale_data, validators = self._stale_entry(cache_key)
 
         try:
             url = f"{self.base_url}/points/{lat},{lon}"
             logger.log_api_call(url)
-            resp = requests.get(url, headers=self.headers, timeout=10)
+            resp = self.session.get(url, headers=validators, timeout=10)
             logger.log_api_call(url, resp.status_code)
 
+            if resp.status_code == 304 and stale_data is not None:
+                return self._revalidated(cache_key, stale_data, validators, resp, 3600)
             if resp.status_code == 200:
                 data = resp.json()
-                self._cache_data(cache_key, data)
+                self._cache_data(cache_key, data, resp, 3600)
                 logger.api_logger.info(f"Got point data for {lat},{lon}")
                 return data
             else:
@@ -265,17 +491,21 @@ class NOAAWeatherAPI:
         """Get observation stations"""
         cache_key = f"stations_{stations_url}"
 
-        if self._is_cache_valid(cache_key, 3600):
-            return self.cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        stale_data, validators = self._stale_entry(cache_key)
 
         try:
             logger.log_api_call(stations_url)
-            resp = requests.get(stations_url, headers=self.headers, timeout=10)
+            resp = self.session.get(stations_url, headers=validators, timeout=10)
             logger.log_api_call(stations_url, resp.status_code)
 
+            if resp.status_code == 304 and stale_data is not None:
+                return self._revalidated(cache_key, stale_data, validators, resp, 3600)
             if resp.status_code == 200:
                 data = resp.json()
-                self._cache_data(cache_key, data)
+                self._cache_data(cache_key, data, resp, 3600)
                 station_count = len(data.get('features', []))
                 logger.api_logger.info(f"Got {station_count} stations")
                 return data
@@ -288,18 +518,22 @@ class NOAAWeatherAPI:
         """Get current weather observations"""
         cache_key = f"obs_{station_id}"
 
-        if self._is_cache_valid(cache_key, 300):
-            return self.cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        stale_data, validators = self._stale_entry(cache_key)
 
         try:
             url = f"{self.base_url}/stations/{station_id}/observations/latest"
             logger.log_api_call(url)
-            resp = requests.get(url, headers=self.headers, timeout=10)
+            resp = self.session.get(url, headers=validators, timeout=10)
             logger.log_api_call(url, resp.status_code)
 
+            if resp.status_code == 304 and stale_data is not None:
+                return self._revalidated(cache_key, stale_data, validators, resp, 300)
             if resp.status_code == 200:
                 data = resp.json()
-                self._cache_data(cache_key, data)
+                self._cache_data(cache_key, data, resp, 300)
                 logger.log_weather_data("current", data.get('properties'))
                 return data
         except Exception as e:
@@ -311,19 +545,23 @@ class NOAAWeatherAPI:
         """Get weather forecast"""
         cache_key = f"forecast_{office}_{gridX}_{gridY}"
 
-        if self._is_cache_valid(cache_key, 1800):
-            return self.cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        stale_data, validators = self._stale_entry(cache_key)
 
         try:
             url = f"{self.base_url}/gridpoints/{office}/{gridX},{gridY}/forecast"
             logger.log_api_call(url)
             params = {'units': units}
-            resp = requests.get(url, headers=self.headers, params=params, timeout=10)
+            resp = self.session.get(url, headers=validators, params=params, timeout=10)
             logger.log_api_call(url, resp.status_code)
 
+            if resp.status_code == 304 and stale_data is not None:
+                return self._revalidated(cache_key, stale_data, validators, resp, 1800)
             if resp.status_code == 200:
                 data = resp.json()
-                self._cache_data(cache_key, data)
+                self._cache_data(cache_key, data, resp, 1800)
                 periods = len(data.get('properties', {}).get('periods', []))
                 logger.api_logger.info(f"Got forecast with {periods} periods")
                 return data
@@ -335,19 +573,23 @@ class NOAAWeatherAPI:
     def get_hourly_forecast(self, office, gridX, gridY, units='us'):
         """Get hourly weather forecast"""
         cache_key = f"hourly_{office}_{gridX}_{gridY}"
-        if self._is_cache_valid(cache_key, 1800):
-            return self.cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        stale_data, validators = self._stale_entry(cache_key)
 
         try:
             url = f"{self.base_url}/gridpoints/{office}/{gridX},{gridY}/forecast/hourly"
             logger.log_api_call(url)
             params = {'units': units}
-            resp = requests.get(url, headers=self.headers, params=params, timeout=10)
+            resp = self.session.get(url, headers=validators, params=params, timeout=10)
             logger.log_api_call(url, resp.status_code)
 
+            if resp.status_code == 304 and stale_data is not None:
+                return self._revalidated(cache_key, stale_data, validators, resp, 1800)
             if resp.status_code == 200:
                 data = resp.json()
-                self._cache_data(cache_key, data)
+                self._cache_data(cache_key, data, resp, 1800)
                 periods = len(data.get('properties', {}).get('periods', []))
                 logger.api_logger.info(f"Got hourly forecast with {periods} periods")
                 return data
@@ -356,10 +598,20 @@ class NOAAWeatherAPI:
             logger.log_error(f"Error getting hourly forecast", e)
         return None
 
+    def fetch_all(self, calls):
+        """Run independent requests concurrently; calls maps each result name to a no-argument callable"""
+        if not calls:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = {name: executor.submit(call) for name, call in calls.items()}
+        # The get_* methods log and swallow their own errors
+        return {name: future.result() for name, future in futures.items()}
+
+
 class WeatherStar4000Complete:
     """Complete WeatherStar 4000 implementation with logging"""
 
-    def __init__(self, lat=None, lon=None):
+    def __init__(self, lat=None, lon=None, fps=DEFAULT_FPS):
         # Try automatic location detection if no coordinates provided
         if lat is None or lon is None:
             auto_result = get_automatic_location()
@@ -400,7 +652,13 @@ class WeatherStar4000Complete:
 
         # Create display
         try:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            try:
+                # Renderer-backed window: hardware presents, and vsync paces flip() to the monitor
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                                      pygame.DOUBLEBUF | pygame.SCALED, vsync=1)
+            except pygame.error as e:
+                logger.main_logger.warning(f"Accelerated display unavailable ({e}), using software surface")
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
             pygame.display.set_caption("WeatherStar 4000+")
             logger.main_logger.info(f"Display created: {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
         except Exception as e:
@@ -409,42 +667,72 @@ class WeatherStar4000Complete:
 
         # Clock for timing
         self.clock = pygame.time.Clock()
+        self.fps = fps
+
+        # Set when the current screen must be fully redrawn and flipped
+        self._dirty = True
+        # Static screen pixels behind the scroller band, reused between redraws
+        self._scroller_backdrop = pygame.Surface(SCROLLER_BAND[2:]).convert()
+        self._scroller_backdrop_ready = False
+
+        # Wall-clock time shared by every draw call in a frame, with the header
+        # time string re-formatted only when the minute changes
+        self.frame_now = None
+        self._frame_minute = None
+        self.frame_time_str = ''
+        self.stamp_frame_time()
+
+        # Rendered header titles by text, and the (time string, surface, rect) last drawn
+        self._header_titles = {}
+        self._header_time = (None, None, None)
+
+        # API client, connecting to api.weather.gov while the assets load
+        self.api = NOAAWeatherAPI()
+        self.api.load_cache(API_CACHE_FILE)
+        self.api.warm_up()
 
         # Load assets
         self.assets_path = Path("weatherstar_assets")
         logger.main_logger.info(f"Loading assets from {self.assets_path}")
 
-        self.backgrounds = self._load_backgrounds()
         self.icons = {}
         self.icon_manager = None  # Will be initialized in _load_icons
-        self._load_icons()
-        self.logos = self._load_logos()
+        self._load_all_assets()
 
         # Initialize fonts
         self._init_fonts()
 
+        # Windows 95 style menu fonts, created once instead of on every menu redraw
+        self.font_menu_title = pygame.font.Font(None, 14)
+        self.font_menu_item = pygame.font.Font(None, 13)
+        # Rendered settings menus keyed by the values they show
+        self._menu_surfaces = {}
+
         # Initialize music
         self._init_music()
 
         # Transition effects
         # Simple 90s style - no complex transitions
 
-        # API client
-        self.api = NOAAWeatherAPI()
-
         # Weather data
         self.weather_data = {}
         self.location = {}
         self.lat = lat
         self.lon = lon
 
+        # Radar state, published by the data module's background fetch
+        self.radar_image = None
+        self.radar_frames = []
+        self.radar_frame_index = 0
+        self.radar_last_update = 0
+
         # Cache city name for local news (avoid repeated API calls)
         self.cached_city_name = None
         self.city_name_cached_at = 0
 
         # Display management
         self.displays = self._init_displays()
-        self.current_display_index = 0
+        self._show_display(0)
         self.display_timer = 0
         self.is_playing = True
 
@@ -452,11 +740,17 @@ class WeatherStar4000Complete:
         # This will be called again after settings are fully set up
 
         # Scrolling text
-        self.scroller = ScrollingText(self.font_scroller if hasattr(self, 'font_scroller') else self.font_small)
+        self.scroller = ScrollingText(self.font_scroller)
+        # Inputs the scroll text was last built from, so unchanged refreshes skip the rebuild
+        self._scroll_signature = None
+
+        # Background weather refresh, so network calls never stall the frame loop
+        self._fetch_thread = None
 
         # Initialize weather data
         self.point_data = None
         self.station = None
+        self.stations_url = None
         self.office = None
         self.gridX = None
         self.gridY = None
@@ -466,7 +760,29 @@ class WeatherStar4000Complete:
 
         logger.main_logger.info("WeatherStar 4000 initialization complete")
 
-    def _load_backgrounds(self):
+    def _load_all_assets(self):
+        """Load backgrounds, icons and logos, decoding the image files on worker threads"""
+        # pygame.image.load releases the GIL while decoding, so the files decode in
+        # parallel; each loader converts its surfaces here on the main thread
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            backgrounds = self._submit_image_loads(executor, self.assets_path / "backgrounds", "*.png")
+            icons = self._submit_image_loads(executor, self.assets_path / "icons", "*.gif")
+            logos = self._submit_image_loads(executor, self.assets_path / "logos", "*.png", "*.gif")
+
+            self.backgrounds = self._load_backgrounds(backgrounds)
+            # Shown for any background name that has no image
+            self._default_background = next(iter(self.backgrounds.values()), None)
+            self._load_icons(icons)
+            self.logos = self._load_logos(logos)
+
+    def _submit_image_loads(self, executor, directory, *patterns):
+        """Start loading the matching files in directory; returns (path, future) pairs"""
+        if not directory.exists():
+            return []
+        return [(path, executor.submit(pygame.image.load, str(path)))
+                for pattern in patterns for path in directory.glob(pattern)]
+
+    def _load_backgrounds(self, pending):
         """Load background images"""
         backgrounds = {}
         bg_path = self.assets_path / "backgrounds"
@@ -474,10 +790,10 @@ class WeatherStar4000Complete:
         logger.main_logger.info(f"Loading backgrounds from {bg_path}")
 
         if bg_path.exists():
-            for bg_file in bg_path.glob("*.png"):
+            for bg_file, future in pending:
                 try:
                     name = bg_file.stem
-                    backgrounds[name] = pygame.image.load(str(bg_file))
+                    backgrounds[name] = self._display_format(future.result())
                     logger.log_asset_load("background", name, True)
                 except Exception as e:
                     logger.log_asset_load("background", str(bg_file), False)
@@ -491,18 +807,23 @@ class WeatherStar4000Complete:
         logger.main_logger.info(f"Loaded {len(backgrounds)} backgrounds")
         return backgrounds
 
+    def _display_format(self, image):
+        """Match the display pixel format so per-frame blits skip conversion"""
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        # convert() keeps a GIF's colorkey transparency
+        return image.convert()
+
     def _create_default_background(self):
         """Create default background if assets not found"""
         logger.main_logger.debug("Creating default background")
-        surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            b = int(128 + 127 * ratio)
-            color = (0, 0, b)
-            pygame.draw.line(surf, color, (0, y), (SCREEN_WIDTH, y))
-        return surf
-
-    def _load_icons(self):
+        # Vertical blue ramp, built as one array instead of a line per row
+        ratio = np.arange(SCREEN_HEIGHT) / SCREEN_HEIGHT
+        pixels = np.zeros((SCREEN_WIDTH, SCREEN_HEIGHT, 3), np.uint8)
+        pixels[:, :, 2] = (128 + 127 * ratio).astype(np.uint8)
+        return pygame.surfarray.make_surface(pixels).convert()
+
+    def _load_icons(self, pending):
         """Load weather icons with animation support"""
         icons_path = self.assets_path / "icons"
         logger.main_logger.info(f"Loading icons from {icons_path}")
@@ -530,11 +851,11 @@ class WeatherStar4000Complete:
         # Fallback: Load static versions for compatibility
         if icons_path.exists():
             icon_count = 0
-            for icon_file in icons_path.glob("*.gif"):
+            for icon_file, future in pending:
                 try:
                     name = icon_file.stem
                     # Load as static image for backwards compatibility
-                    self.icons[name] = pygame.image.load(str(icon_file))
+                    self.icons[name] = self._display_format(future.result())
                     logger.log_asset_load("icon", name, True)
                     icon_count += 1
                 except Exception as e:
@@ -545,27 +866,18 @@ class WeatherStar4000Complete:
         else:
             logger.main_logger.warning(f"Icons path not found: {icons_path}")
 
-    def _load_logos(self):
+    def _load_logos(self, pending):
         """Load TWC logos"""
         logos = {}
         logos_path = self.assets_path / "logos"
         logger.main_logger.info(f"Loading logos from {logos_path}")
 
         if logos_path.exists():
-            # Load PNG logos
-            for logo_file in logos_path.glob("*.png"):
+            # PNG logos, then GIF logos (NOAA)
+            for logo_file, future in pending:
                 try:
                     name = logo_file.stem
-                    logos[name] = pygame.image.load(str(logo_file))
-                    logger.log_asset_load("logo", name, True)
-                except Exception as e:
-                    logger.log_asset_load("logo", str(logo_file), False)
-                    logger.log_error(f"Error loading logo {logo_file}", e)
-            # Load GIF logos (NOAA)
-            for logo_file in logos_path.glob("*.gif"):
-                try:
-                    name = logo_file.stem
-                    logos[name] = pygame.image.load(str(logo_file))
+                    logos[name] = self._display_format(future.result())
                     logger.log_asset_load("logo", name, True)
                 except Exception as e:
                     logger.log_asset_load("logo", str(logo_file), False)
@@ -607,23 +919,27 @@ class WeatherStar4000Complete:
         logger.main_logger.info("Star4000 fonts not found, using fallback fonts")
         font_candidates = ['consolas', 'courier new', 'courier', 'monospace', 'dejavu sans mono']
         selected_font = None
+        bold_path = None
         for font_name in font_candidates:
-            font_path = pygame.font.match_font(font_name, bold=True)
-            if font_path:
+            bold_path = pygame.font.match_font(font_name, bold=True)
+            if bold_path:
                 selected_font = font_name
                 logger.main_logger.info(f"Using font: {font_name}")
                 break
 
         if selected_font:
+            # Each match_font call scans the system font list, so resolve both weights once
+            regular_path = pygame.font.match_font(selected_font, bold=False)
+
             # Match ws4kp font sizes (24pt = 32px)
-            self.font_title = pygame.font.Font(pygame.font.match_font(selected_font, bold=True), 32)  # Star4000
-            self.font_large = pygame.font.Font(pygame.font.match_font(selected_font, bold=True), 32)  # Star4000 Large
-            self.font_extended = pygame.font.Font(pygame.font.match_font(selected_font, bold=True), 32)  # Star4000 Extended
-            self.font_normal = pygame.font.Font(pygame.font.match_font(selected_font, bold=False), 20)  # For data
-            self.font_small = pygame.font.Font(pygame.font.match_font(selected_font, bold=False), 28)  # Star4000 Small - reduced
-            self.font_forecast = pygame.font.Font(pygame.font.match_font(selected_font, bold=False), 24)  # For Local Forecast
-            self.font_tiny = pygame.font.Font(pygame.font.match_font(selected_font, bold=False), 16)  # Tiny font
-            self.font_scroller = pygame.font.Font(pygame.font.match_font(selected_font, bold=True), 24)  # Sized to fit in banner
+            self.font_title = pygame.font.Font(bold_path, 32)  # Star4000
+            self.font_large = pygame.font.Font(bold_path, 32)  # Star4000 Large
+            self.font_extended = pygame.font.Font(bold_path, 32)  # Star4000 Extended
+            self.font_normal = pygame.font.Font(regular_path, 20)  # For data
+            self.font_small = pygame.font.Font(regular_path, 28)  # Star4000 Small - reduced
+            self.font_forecast = pygame.font.Font(regular_path, 24)  # For Local Forecast
+            self.font_tiny = pygame.font.Font(regular_path, 16)  # Tiny font
+            self.font_scroller = pygame.font.Font(bold_path, 24)  # Sized to fit in banner
             logger.main_logger.debug(f"Fonts initialized with {selected_font}")
         else:
             logger.main_logger.warning("No suitable font found, using defaults")
@@ -671,12 +987,13 @@ class WeatherStar4000Complete:
                 random.shuffle(self.music_playlist)
                 self.current_song_index = 0
 
-                # Load and play first song
+                # Load and play first song; the end event moves on to the next one
                 first_song = self.music_playlist[0]
                 try:
-                    pygame.mixer.music.load(str(first_song.absolute()))
+                    pygame.mixer.music.load(str(first_song))
                     pygame.mixer.music.set_volume(0.6)  # 60% volume
-                    pygame.mixer.music.play(-1)  # Loop indefinitely
+                    pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+                    pygame.mixer.music.play()
                     logger.main_logger.info(f"Playing music: {first_song.name}")
                     logger.main_logger.info(f"Music volume: {pygame.mixer.music.get_volume()}")
                     # Check if music is actually playing
@@ -693,6 +1010,17 @@ class WeatherStar4000Complete:
         except Exception as e:
             logger.log_error("Failed to initialize music", e)
 
+    def _play_next_song(self):
+        """Start the next playlist track after the current one ends"""
+        self.current_song_index = (self.current_song_index + 1) % len(self.music_playlist)
+        song = self.music_playlist[self.current_song_index]
+        try:
+            pygame.mixer.music.load(str(song))
+            pygame.mixer.music.play()
+            logger.main_logger.info(f"Playing music: {song.name}")
+        except pygame.error as e:
+            logger.log_error(f"Failed to play music file {song.name}", e)
+
     def _init_displays(self):
         """Initialize display screens"""
         displays = [
@@ -752,64 +1080,103 @@ class WeatherStar4000Complete:
 
         logger.main_logger.info(f"Location: {self.location['city']}, {self.location['state']}")
 
-        # Get observation stations
-        stations_url = props.get('observationStations')
-        if stations_url:
-            stations = self.api.get_stations(stations_url)
-            if stations and stations.get('features'):
-                # Filter for 4-letter stations
-                for feature in stations['features']:
-                    station_id = feature['properties']['stationIdentifier']
-                    if len(station_id) == 4 and not station_id[0] in 'UC':
-                        self.station = station_id
-                        logger.main_logger.info(f"Selected 4-letter station: {station_id}")
-                        break
-
-                if not self.station and stations['features']:
-                    self.station = stations['features'][0]['properties']['stationIdentifier']
-                    logger.main_logger.info(f"Using first available station: {self.station}")
-        else:
+        # The observation station is picked by the first weather update, so the
+        # stations request runs alongside the forecast requests instead of before them
+        self.stations_url = props.get('observationStations')
+        if not self.stations_url:
             logger.main_logger.warning("No observation stations URL")
 
-        logger.main_logger.info(f"Initialization complete - Station: {self.station}")
+        logger.main_logger.info(f"Initialization complete - Office: {self.office}")
+        return True
+
+    def _select_station(self):
+        """Pick the observation station from the point's station list, or None"""
+        stations = self.api.get_stations(self.stations_url)
+        if stations and stations.get('features'):
+            # Filter for 4-letter stations
+            for feature in stations['features']:
+                station_id = feature['properties']['stationIdentifier']
+                if len(station_id) == 4 and not station_id[0] in 'UC':
+                    logger.main_logger.info(f"Selected 4-letter station: {station_id}")
+                    return station_id
+
+            station_id = stations['features'][0]['properties']['stationIdentifier']
+            logger.main_logger.info(f"Using first available station: {station_id}")
+            return station_id
+        return None
+
+    def _current_observations(self):
+        """Latest observations, choosing the station first if it isn't known yet"""
+        station = self.station
+        if not station and self.stations_url:
+            # Published with one assignment once chosen
+            station = self.station = self._select_station()
+        if not station:
+            logger.main_logger.warning("No observation station available")
+            return None
+        return self.api.get_current_observations(station)
+
+    def _start_update(self):
+        """Refresh weather data in a background thread unless a refresh is already running"""
+        if self._fetch_thread is not None and self._fetch_thread.is_alive():
+            logger.main_logger.debug("Weather update already in progress")
+            return False
+
+        self._fetch_thread = threading.Thread(target=self.update_weather_data, daemon=True)
+        self._fetch_thread.start()
         return True
 
     def update_weather_data(self):
         """Update all weather data"""
         logger.main_logger.info("Updating weather data...")
 
-        if not self.station or not self.office:
-            logger.main_logger.warning("Missing station or office data")
+        if not self.office:
+            logger.main_logger.warning("Missing office data")
             return
 
+        # Preload radar image in the background to prevent stuttering; it only needs
+        # the location, so it downloads alongside the forecast requests below
+        logger.main_logger.info("Preloading radar image...")
+        if self.data_module:
+            self.data_module.start_radar_fetch()
+        else:
+            logger.main_logger.warning("Data module not available for radar image fetching")
+
+        # Build the update in a new dict and publish it with a single assignment,
+        # so the draw loop never sees a half-updated weather_data
+        weather_data = dict(self.weather_data)
+
+        # The three requests are independent, so they run side by side
+        results = self.api.fetch_all({
+            'current': self._current_observations,
+            'forecast': partial(self.api.get_forecast, self.office, self.gridX, self.gridY),
+            'hourly': partial(self.api.get_hourly_forecast, self.office, self.gridX, self.gridY),
+        })
+
         # Get current observations
-        obs = self.api.get_current_observations(self.station)
+        obs = results['current']
         if obs:
-            self.weather_data['current'] = obs.get('properties', {})
+            weather_data['current'] = obs.get('properties', {})
             logger.main_logger.info("Current observations updated")
 
         # Get forecast
-        forecast = self.api.get_forecast(self.office, self.gridX, self.gridY)
+        forecast = results['forecast']
         if forecast:
-            self.weather_data['forecast'] = forecast.get('properties', {})
+            weather_data['forecast'] = forecast.get('properties', {})
             logger.main_logger.info("Forecast updated")
 
-            # Update scrolling text with new weather data
-            if hasattr(self, 'scroller'):
-                self._update_scroll_text()
-
         # Get hourly forecast
-        hourly_forecast = self.api.get_hourly_forecast(self.office, self.gridX, self.gridY)
+        hourly_forecast = results['hourly']
         if hourly_forecast:
-            self.weather_data['hourly'] = hourly_forecast.get('properties', {})
+            weather_data['hourly'] = hourly_forecast.get('properties', {})
             logger.main_logger.info("Hourly forecast updated")
 
-        # Preload radar image to prevent stuttering
-        logger.main_logger.info("Preloading radar image...")
-        if self.data_module:
-            self.data_module.fetch_radar_image()
-        else:
-            logger.main_logger.warning("Data module not available for radar image fetching")
+        self.weather_data = weather_data
+        self._dirty = True
+
+        # Update scrolling text with new weather data (skipped inside if nothing it shows changed)
+        if (obs or forecast) and hasattr(self, 'scroller'):
+            self._update_scroll_text()
 
     def _update_scroll_text(self):
         """Update scrolling text with current weather information"""
@@ -818,18 +1185,39 @@ class WeatherStar4000Complete:
                 logger.main_logger.warning("No scroller available")
                 return
 
-            # Clear existing text items
-            self.scroller.text_items = []
+            # Snapshot once so a background refresh can't swap data mid-build
+            weather_data = self.weather_data
+            location = self.location if hasattr(self, 'location') and self.location else {}
+            current = weather_data.get('current', {})
+            periods = weather_data.get('forecast', {}).get('periods', [])
+
+            # Skip the rebuild when none of the values shown in the scroller changed
+            signature = (
+                location.get('city'), location.get('state'),
+                current.get('temperature', {}).get('value'),
+                current.get('textDescription', 'Unknown'),
+                current.get('relativeHumidity', {}).get('value'),
+                current.get('windSpeed', {}).get('value'),
+                current.get('windDirection', {}).get('value'),
+                tuple((p.get('name'), p.get('shortForecast'), p.get('temperature'), p.get('isDaytime'))
+                      for p in periods[:3]),
+            )
+            if signature == self._scroll_signature:
+                logger.main_logger.debug("Scroll text inputs unchanged, keeping current items")
+                return
+
+            # Built locally and handed to the main thread in one piece, since the
+            # scroller rotates its list from the frame loop
+            items = []
 
             # Add location information
-            if hasattr(self, 'location') and self.location:
-                city = self.location.get('city', '')
-                state = self.location.get('state', '')
+            if location:
+                city = location.get('city', '')
+                state = location.get('state', '')
                 if city and state:
-                    self.scroller.add_item(f" +++ {city.upper()}, {state} +++ ")
+                    items.append(f" +++ {city.upper()}, {state} +++ ")
 
             # Add current conditions if available
-            current = self.weather_data.get('current', {})
             if current:
                 temp = current.get('temperature', {}).get('value')
                 conditions = current.get('textDescription', 'Unknown')
@@ -840,7 +1228,7 @@ class WeatherStar4000Complete:
                 # Build current conditions text
                 current_text = ""
                 if temp is not None:
-                    temp_f = round(temp * 9/5 + 32)
+                    temp_f = round(temp * C_TO_F_SCALE + 32)
                     current_text = f"CURRENTLY: {temp_f}°F, {conditions}"
 
                     # Add humidity if available
@@ -849,7 +1237,7 @@ class WeatherStar4000Complete:
 
                     # Add wind information if available
                     if wind_speed is not None:
-                        wind_mph = round(wind_speed * 2.237)  # Convert m/s to mph
+                        wind_mph = round(wind_speed * MS_TO_MPH)
                         wind_text = f" ... WIND: "
                         if wind_dir is not None:
                             direction = self._get_wind_direction(wind_dir)
@@ -857,11 +1245,9 @@ class WeatherStar4000Complete:
                         wind_text += f"{wind_mph} MPH"
                         current_text += wind_text
 
-                    self.scroller.add_item(current_text)
+                    items.append(current_text)
 
             # Add today's high/low and forecast
-            forecast = self.weather_data.get('forecast', {})
-            periods = forecast.get('periods', [])
             if periods:
                 today = periods[0]
                 today_name = today.get('name', 'Today')
@@ -894,7 +1280,7 @@ class WeatherStar4000Complete:
                     elif low_temp:
                         forecast_text += f", LOW {low_temp}°F"
 
-                    self.scroller.add_item(forecast_text + " +++ ")
+                    items.append(forecast_text + " +++ ")
 
                 # Add tonight's forecast if available
                 if len(periods) > 1:
@@ -907,7 +1293,7 @@ class WeatherStar4000Complete:
                             tonight_text = f" +++ {tonight_name.upper()}: {tonight_forecast.upper()}"
                             if tonight_temp:
                                 tonight_text += f", LOW {tonight_temp}°F"
-                            self.scroller.add_item(tonight_text + " +++ ")
+                            items.append(tonight_text + " +++ ")
 
                 # Add tomorrow's forecast if available
                 if len(periods) > 2:
@@ -920,19 +1306,20 @@ class WeatherStar4000Complete:
                             tomorrow_text = f" +++ {tomorrow_name.upper()}: {tomorrow_forecast.upper()}"
                             if tomorrow_temp:
                                 tomorrow_text += f", HIGH {tomorrow_temp}°F"
-                            self.scroller.add_item(tomorrow_text + " +++ ")
+                            items.append(tomorrow_text + " +++ ")
 
             # Add weather alerts placeholder (could be enhanced with actual alerts)
-            self.scroller.add_item(" +++ NO WEATHER WARNINGS OR ADVISORIES IN EFFECT +++ ")
+            items.append(" +++ NO WEATHER WARNINGS OR ADVISORIES IN EFFECT +++ ")
 
             # Add informational message
-            self.scroller.add_item(" +++ VISIT WEATHER.GOV FOR THE LATEST WEATHER INFORMATION +++ ")
+            items.append(" +++ VISIT WEATHER.GOV FOR THE LATEST WEATHER INFORMATION +++ ")
 
-            # Initialize current text if empty
-            if not self.scroller.current_text and self.scroller.text_items:
-                self.scroller.current_text = self.scroller.text_items[0]
+            if not pygame.event.post(pygame.event.Event(SCROLL_TEXT_EVENT, items=items)):
+                logger.main_logger.warning("Event queue full, scroll text update dropped")
+                return
 
-            logger.main_logger.info(f"Updated scroll text with {len(self.scroller.text_items)} items")
+            self._scroll_signature = signature
+            logger.main_logger.info(f"Updated scroll text with {len(items)} items")
 
         except Exception as e:
             logger.main_logger.error(f"Error updating scroll text: {e}")
@@ -941,19 +1328,14 @@ class WeatherStar4000Complete:
         """Convert wind degrees to compass direction"""
         if degrees is None:
             return ''
-        directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-                     'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
         idx = int((degrees + 11.25) / 22.5) % 16
-        return directions[idx]
+        return WIND_DIRECTIONS[idx]
 
     def draw_background(self, bg_name='1'):
         """Draw background image"""
-        if bg_name in self.backgrounds:
-            self.screen.blit(self.backgrounds[bg_name], (0, 0))
-        else:
-            bg = list(self.backgrounds.values())[0] if self.backgrounds else None
-            if bg:
-                self.screen.blit(bg, (0, 0))
+        bg = self.backgrounds.get(bg_name, self._default_background)
+        if bg:
+            self.screen.blit(bg, (0, 0))
 
     def draw_header(self, title_top, title_bottom=None, has_noaa=False):
         """Draw standard header matching ws4kp exact layout"""
@@ -964,36 +1346,112 @@ class WeatherStar4000Complete:
         # Title at exact position: left: 170px
         if title_bottom:
             # Dual line title - top: -3px (relative), bottom: 26px (relative)
-            text1 = self.font_title.render(title_top.upper(), True, COLORS['yellow'])
-            text2 = self.font_title.render(title_bottom.upper(), True, COLORS['yellow'])
+            text1 = self._header_title(title_top)
+            text2 = self._header_title(title_bottom)
             self.screen.blit(text1, (170, 27))  # Adjusted for absolute positioning
             self.screen.blit(text2, (170, 53))  # 26px below the first line
         else:
             # Single line title - top: 40px
-            text = self.font_title.render(title_top.upper(), True, COLORS['yellow'])
+            text = self._header_title(title_top)
             self.screen.blit(text, (170, 40))
 
         # NOAA logo at exact position: top: 39px, left: 356px
         if has_noaa and 'noaa' in self.logos:
             self.screen.blit(self.logos['noaa'], (356, 39))
 
-        # Time at exact position: left: 415px, right-aligned within 170px width
-        time_str = datetime.now().strftime("%I:%M %p").lstrip('0')
-        time_text = self.font_small.render(time_str, True, COLORS['white'])
-        # Right-align within the box from 415 to 585 (415 + 170)
-        time_rect = time_text.get_rect(right=585, y=44)
+        # Time at exact position: left: 415px, right-aligned within 170px width,
+        # re-rendered only when the displayed minute changes
+        if self._header_time[0] != self.frame_time_str:
+            time_text = self.font_small.render(self.frame_time_str, True, COLORS['white'])
+            # Right-align within the box from 415 to 585 (415 + 170)
+            self._header_time = (self.frame_time_str, time_text, time_text.get_rect(right=585, y=44))
+        _, time_text, time_rect = self._header_time
         self.screen.blit(time_text, time_rect)
 
+    def _header_title(self, title):
+        """Rendered header title line; each screen's title is rasterized once"""
+        text = self._header_titles.get(title)
+        if text is None:
+            text = self.font_title.render(title.upper(), True, COLORS['yellow'])
+            self._header_titles[title] = text
+        return text
+
+    def _headline_url_at(self, pos):
+        """Return the URL of the clickable headline under pos, if any
+
+        Headlines are (rect, url) pairs appended top to bottom as they are drawn,
+        so the list is sorted by rect.top and a binary search finds the only candidate.
+        """
+        headlines = getattr(self, 'clickable_headlines', None)
+        if not headlines:
+            return None
+
+        y = pos[1]
+        lo, hi = 0, len(headlines)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if headlines[mid][0].top <= y:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        # headlines[lo - 1] is the last one starting at or above the click
+        if lo:
+            rect, url = headlines[lo - 1]
+            if rect.collidepoint(pos):
+                return url
+        return None
+
+    def _build_draw_dispatch(self):
+        """Map each display mode to the module method that draws it"""
+        dispatch = {}
+        if self.displays_module:
+            displays = self.displays_module
+            dispatch.update({
+                DisplayMode.CURRENT_CONDITIONS: displays.draw_current_conditions,
+                DisplayMode.LOCAL_FORECAST: displays.draw_local_forecast,
+                DisplayMode.EXTENDED_FORECAST: displays.draw_extended_forecast,
+                DisplayMode.HOURLY_FORECAST: displays.draw_hourly_forecast,
+                DisplayMode.REGIONAL_OBSERVATIONS: displays.draw_latest_observations,
+                DisplayMode.TRAVEL_CITIES: displays.draw_travel_cities,
+                DisplayMode.MARINE_FORECAST: displays.draw_marine_forecast,
+                DisplayMode.AIR_QUALITY: displays.draw_air_quality,
+                DisplayMode.TEMPERATURE_GRAPH: displays.draw_temperature_graph,
+                DisplayMode.WEATHER_RECORDS: displays.draw_weather_records,
+                DisplayMode.SUN_MOON: displays.draw_sun_moon,
+                DisplayMode.WIND_PRESSURE: displays.draw_wind_pressure,
+                DisplayMode.WEEKEND_FORECAST: displays.draw_weekend_forecast,
+                DisplayMode.MONTHLY_OUTLOOK: displays.draw_monthly_outlook,
+                DisplayMode.ALMANAC: displays.draw_almanac,
+                DisplayMode.HAZARDS: displays.draw_hazards,
+                DisplayMode.RADAR: displays.draw_radar,
+            })
+        if self.news_module:
+            news = self.news_module
+            dispatch.update({
+                DisplayMode.MSN_NEWS: news.draw_msn_news,
+                DisplayMode.REDDIT_NEWS: news.draw_reddit_news,
+                DisplayMode.LOCAL_NEWS: news.draw_local_news,
+            })
+        return dispatch
+
+    def _draw_fallback(self, mode):
+        """Draw a titled blank screen for modes without a draw method"""
+        self.draw_background('1')
+        self.draw_header(DISPLAY_TITLES[mode])
+
+    def stamp_frame_time(self):
+        """Record the current time for this frame's draw calls"""
+        now = datetime.now()
+        self.frame_now = now
+        minute = now.replace(second=0, microsecond=0)
+        if minute != self._frame_minute:
+            self._frame_minute = minute
+            self.frame_time_str = now.strftime("%I:%M %p").lstrip('0')
+            self._dirty = True  # Header clock changed
+
     def show_context_menu(self):
         """Show Windows 95-style menu on right-click"""
-        # Classic Windows 95 colors
-        WIN95_GREY = (192, 192, 192)  # Classic Windows grey
-        WIN95_DARK = (128, 128, 128)  # Dark grey for shadows
-        WIN95_LIGHT = (255, 255, 255)  # White for highlights
-        WIN95_BLACK = (0, 0, 0)  # Black text
-        WIN95_BLUE = (0, 0, 128)  # Selection blue
-        WIN95_SELECTED = (10, 36, 106)  # Navy blue for selected items
-
         # Check for settings attribute
         if not hasattr(self, 'settings'):
             self.settings = {
@@ -1007,9 +1465,100 @@ class WeatherStar4000Complete:
             'show_local_news': True
             }
 
-        # Create smaller, compact menu
+        # Create smaller, compact menu, centered on screen
         menu_width = 280
         menu_height = 320
+        menu_x = (self.screen.get_width() - menu_width) // 2
+        menu_y = (self.screen.get_height() - menu_height) // 2
+
+        # Wait for input, polling at 30 FPS instead of spinning the CPU;
+        # a toggle marks the menu dirty and it is redrawn at the top of the loop
+        menu_clock = pygame.time.Clock()
+        waiting = True
+        dirty = True
+        while waiting:
+            if dirty:
+                menu_items = self._menu_items()
+                # The menu only changes with the values it shows, so each combination is drawn once.
+                # Volume is keyed by its displayed percentage; the raw float drifts as it steps
+                menu_key = tuple(int(round(value * 100)) if setting == "volume" else value
+                                 for _, setting, value in menu_items)
+                menu_surface = self._menu_surfaces.get(menu_key)
+                if menu_surface is None:
+                    menu_surface = self._build_menu_surface(menu_items, menu_width, menu_height)
+                    self._menu_surfaces[menu_key] = menu_surface
+
+                self.screen.blit(menu_surface, (menu_x, menu_y))
+                # Only the menu changed since the last frame, so only push that region
+                pygame.display.update(pygame.Rect(menu_x, menu_y, menu_width, menu_height))
+                dirty = False
+
+            menu_clock.tick(30)
+            # Leave weather refresh, music, scroll text and radar events queued for the main loop
+            for event in pygame.event.get(exclude=(WEATHER_UPDATE_EVENT, MUSIC_END_EVENT, SCROLL_TEXT_EVENT,
+                                                   RADAR_FRAMES_EVENT)):
+                if event.type == pygame.KEYDOWN:
+                    toggle = MENU_TOGGLES.get(event.key)
+                    if toggle:
+                        setting, default, changes_rotation, label = toggle
+                        self.settings[setting] = not self.settings.get(setting, default)
+                        if changes_rotation:
+                            self.update_display_list()
+                        logger.main_logger.info(f"{label}: {self.settings[setting]}")
+                        dirty = True
+                    elif event.key == pygame.K_ESCAPE:
+                        waiting = False
+                    elif event.key == pygame.K_4:
+                        current_vol = self.settings.get('music_volume', 0.3)
+                        new_vol = (current_vol + 0.1) % 1.1
+                        if new_vol > 1.0:
+                            new_vol = 0.0
+                        self.settings['music_volume'] = new_vol
+                        if pygame.mixer.get_init():
+                            pygame.mixer.music.set_volume(new_vol)
+                        logger.main_logger.info(f"Music volume: {int(new_vol * 100)}%")
+                        dirty = True
+                    elif event.key == pygame.K_r:
+                        self.api.expire_cache()
+                        self._start_update()
+                        logger.main_logger.info("Weather data refreshed")
+                        waiting = False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    # Click to close menu
+                    mouse_x, mouse_y = event.pos
+                    if not (menu_x <= mouse_x <= menu_x + menu_width and menu_y <= mouse_y <= menu_y + menu_height):
+                        waiting = False
+
+    def _menu_items(self):
+        """Settings menu rows as (label, setting, current value)"""
+        return [
+            ("[1] Marine Forecast", "show_marine", self.settings.get('show_marine', False)),
+            ("[2] Weather Trends", "show_trends", self.settings.get('show_trends', True)),
+            ("[3] Historical Data", "show_historical", self.settings.get('show_historical', True)),
+            ("---", None, None),  # Separator
+            ("Audio Settings", "category", None),
+            ("[4] Music Volume", "volume", self.settings.get('music_volume', 0.3)),
+            ("---", None, None),  # Separator
+            ("News & Information", "category", None),
+            ("[5] MSN Top Stories", "show_msn", self.settings.get('show_msn', False)),
+            ("[6] Reddit Headlines", "show_reddit", self.settings.get('show_reddit', False)),
+            ("[7] Local News", "show_local_news", self.settings.get('show_local_news', True)),
+            ("---", None, None),  # Separator
+            ("System", "category", None),
+            ("[R] Refresh Weather", "refresh", None),
+            ("[ESC] Close Menu", None, None)
+        ]
+
+    def _build_menu_surface(self, menu_items, menu_width, menu_height):
+        """Draw the settings menu for the given items"""
+        # Classic Windows 95 colors
+        WIN95_GREY = (192, 192, 192)  # Classic Windows grey
+        WIN95_DARK = (128, 128, 128)  # Dark grey for shadows
+        WIN95_LIGHT = (255, 255, 255)  # White for highlights
+        WIN95_BLACK = (0, 0, 0)  # Black text
+        WIN95_BLUE = (0, 0, 128)  # Selection blue
+        WIN95_SELECTED = (10, 36, 106)  # Navy blue for selected items
+
         menu_surface = pygame.Surface((menu_width, menu_height))
         menu_surface.fill(WIN95_GREY)
 
@@ -1025,13 +1574,13 @@ class WeatherStar4000Complete:
         title_height = 18
         title_rect = pygame.Rect(2, 2, menu_width-4, title_height)
         pygame.draw.rect(menu_surface, WIN95_SELECTED, title_rect)
-        title_font = pygame.font.Font(None, 14)  # Smaller font
+        title_font = self.font_menu_title  # Smaller font
         title = title_font.render("WeatherStar Settings", True, WIN95_LIGHT)
         menu_surface.blit(title, (6, 5))
 
         # Menu categories with separators
         y_pos = 25
-        item_font = pygame.font.Font(None, 13)  # Small Windows font
+        item_font = self.font_menu_item  # Small Windows font
 
         # Category: Display Options
         category = item_font.render("Display Options", True, WIN95_BLACK)
@@ -1040,24 +1589,6 @@ class WeatherStar4000Complete:
         pygame.draw.line(menu_surface, WIN95_DARK, (8, y_pos), (menu_width-8, y_pos), 1)
         y_pos += 4
 
-        menu_items = [
-            ("[1] Marine Forecast", "show_marine", self.settings.get('show_marine', False)),
-            ("[2] Weather Trends", "show_trends", self.settings.get('show_trends', True)),
-            ("[3] Historical Data", "show_historical", self.settings.get('show_historical', True)),
-            ("---", None, None),  # Separator
-            ("Audio Settings", "category", None),
-            ("[4] Music Volume", "volume", self.settings.get('music_volume', 0.3)),
-            ("---", None, None),  # Separator
-            ("News & Information", "category", None),
-            ("[5] MSN Top Stories", "show_msn", self.settings.get('show_msn', False)),
-            ("[6] Reddit Headlines", "show_reddit", self.settings.get('show_reddit', False)),
-            ("[7] Local News", "show_local_news", self.settings.get('show_local_news', True)),
-            ("---", None, None),  # Separator
-            ("System", "category", None),
-            ("[R] Refresh Weather", "refresh", None),
-            ("[ESC] Close Menu", None, None)
-        ]
-
         for text, setting, value in menu_items:
             if text == "---":
                 # Draw separator line
@@ -1092,83 +1623,14 @@ class WeatherStar4000Complete:
 
                 # Draw text
                 if setting == "volume":
-                    vol_pct = int(value * 100)
+                    vol_pct = int(round(value * 100))
                     text = f"{text}: {vol_pct}%"
 
                 item_text = item_font.render(text, True, WIN95_BLACK)
                 menu_surface.blit(item_text, (item_x, y_pos))
                 y_pos += 18
 
-        # Display menu centered on screen
-        menu_x = (self.screen.get_width() - menu_width) // 2
-        menu_y = (self.screen.get_height() - menu_height) // 2
-        self.screen.blit(menu_surface, (menu_x, menu_y))
-        pygame.display.flip()
-
-        # Wait for input
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        waiting = False
-                    elif event.key == pygame.K_1:
-                        self.settings['show_marine'] = not self.settings.get('show_marine', False)
-                        self.update_display_list()
-                        logger.main_logger.info(f"Marine forecast: {self.settings['show_marine']}")
-                        self.show_context_menu()  # Redraw menu
-                        return
-                    elif event.key == pygame.K_2:
-                        self.settings['show_trends'] = not self.settings.get('show_trends', True)
-                        logger.main_logger.info(f"Weather trends: {self.settings['show_trends']}")
-                        self.show_context_menu()  # Redraw menu
-                        return
-                    elif event.key == pygame.K_3:
-                        self.settings['show_historical'] = not self.settings.get('show_historical', True)
-                        logger.main_logger.info(f"Historical data: {self.settings['show_historical']}")
-                        self.show_context_menu()  # Redraw menu
-                        return
-                    elif event.key == pygame.K_4:
-                        current_vol = self.settings.get('music_volume', 0.3)
-                        new_vol = (current_vol + 0.1) % 1.1
-                        if new_vol > 1.0:
-                            new_vol = 0.0
-                        self.settings['music_volume'] = new_vol
-                        if self.music:
-                            self.music.set_volume(new_vol)
-                        logger.main_logger.info(f"Music volume: {int(new_vol * 100)}%")
-                        self.show_context_menu()  # Redraw menu
-                        return
-                    elif event.key == pygame.K_5:
-                        # Toggle MSN news
-                        self.settings['show_msn'] = not self.settings.get('show_msn', False)
-                        self.update_display_list()
-                        logger.main_logger.info(f"MSN news: {self.settings['show_msn']}")
-                        self.show_context_menu()  # Redraw menu
-                        return
-                    elif event.key == pygame.K_6:
-                        # Toggle Reddit news
-                        self.settings['show_reddit'] = not self.settings.get('show_reddit', False)
-                        self.update_display_list()
-                        logger.main_logger.info(f"Reddit news: {self.settings['show_reddit']}")
-                        self.show_context_menu()  # Redraw menu
-                        return
-                    elif event.key == pygame.K_7:
-                        # Toggle Local news
-                        self.settings['show_local_news'] = not self.settings.get('show_local_news', True)
-                        self.update_display_list()
-                        logger.main_logger.info(f"Local news: {self.settings['show_local_news']}")
-                        self.show_context_menu()  # Redraw menu
-                        return
-                    elif event.key == pygame.K_r:
-                        self.get_weather_data()
-                        logger.main_logger.info("Weather data refreshed")
-                        waiting = False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Click to close menu
-                    mouse_x, mouse_y = event.pos
-                    if not (menu_x <= mouse_x <= menu_x + menu_width and menu_y <= mouse_y <= menu_y + menu_height):
-                        waiting = False
+        return menu_surface
 
     def update_display_list(self):
         """Update display list based on settings"""
@@ -1197,6 +1659,9 @@ class WeatherStar4000Complete:
 
         self.display_list = base_displays
         self.displays = [mode for mode in self.display_list if mode != DisplayMode.PROGRESS]
+        # Keep the position valid if the list shrank
+        self._show_display(self.current_display_index)
+
 
 
 
@@ -1204,22 +1669,41 @@ class WeatherStar4000Complete:
 
 
 
+    def _show_display(self, index):
+        """Make displays[index] (wrapping around) the current screen"""
+        self.current_display_index = index % len(self.displays)
+        self._current_mode = self.displays[self.current_display_index]
 
     def cycle_display(self):
         """Cycle to next display - simple 90s style"""
-        old_mode = self.displays[self.current_display_index]
-        self.current_display_index = (self.current_display_index + 1) % len(self.displays)
-        new_mode = self.displays[self.current_display_index]
+        old_mode = self._current_mode
+        self._show_display(self.current_display_index + 1)
+        new_mode = self._current_mode
         self.display_timer = 0
+        self._dirty = True
         logger.log_display_change(old_mode.value, new_mode.value)
 
     def run(self):
         """Main application loop"""
         logger.main_logger.info("Starting main loop")
 
-        # Initialize location quickly
-        if not self.initialize_location():
+        # Look up the location on a worker so the window keeps answering events
+        # (and can be closed) while the NWS point and station requests run
+        init_result = []
+        init_thread = threading.Thread(
+            target=lambda: init_result.append(self.initialize_location()), daemon=True)
+        init_thread.start()
+        while init_thread.is_alive():
+            if pygame.event.get(pygame.QUIT):
+                logger.main_logger.info("Quit event received during startup")
+                # Keep whatever the startup requests fetched
+                self.api.save_cache(API_CACHE_FILE)
+                return
+            self.clock.tick(self.fps)
+
+        if not init_result or not init_result[0]:
             logger.main_logger.error("Failed to initialize location, exiting")
+            self.api.save_cache(API_CACHE_FILE)
             return
 
         # Start with minimal data - just get current conditions quickly
@@ -1232,18 +1716,30 @@ class WeatherStar4000Complete:
             self._update_scroll_text()
             logger.main_logger.info("Background data loading complete")
 
-        data_thread = threading.Thread(target=load_data_background, daemon=True)
-        data_thread.start()
+        self._fetch_thread = threading.Thread(target=load_data_background, daemon=True)
+        self._fetch_thread.start()
+
+        # Display mode -> draw method, looked up once per frame
+        draw_dispatch = self._build_draw_dispatch()
+
+        # Refresh weather every 5 minutes; the first timer event fires one interval from now
+        pygame.time.set_timer(WEATHER_UPDATE_EVENT, WEATHER_UPDATE_INTERVAL_MS)
 
         # Show first page immediately while loading
         running = True
-        last_update = time.time()  # Set to current time so we don't immediately update again
         frame_count = 0
 
         try:
             while running:
+                # Nothing is visible while minimized, so sleep until an event
+                # (restore, input, weather timer) instead of drawing every frame
+                if not pygame.display.get_active():
+                    event = pygame.event.wait(MINIMIZED_WAIT_MS)
+                    if event.type != pygame.NOEVENT:
+                        pygame.event.post(event)
+
                 frame_count += 1
-                dt = self.clock.tick(30)  # 30 FPS
+                dt = self.clock.tick(self.fps)
                 self.display_timer += dt
 
                 # Handle events
@@ -1251,36 +1747,32 @@ class WeatherStar4000Complete:
                     if event.type == pygame.QUIT:
                         logger.main_logger.info("Quit event received")
                         running = False
+                    elif event.type == pygame.WINDOWEXPOSED:
+                        self._dirty = True
+                    elif event.type == WEATHER_UPDATE_EVENT:
+                        logger.main_logger.info("5-minute weather update")
+                        self._start_update()
+                    elif event.type == MUSIC_END_EVENT:
+                        self._play_next_song()
+                    elif event.type == SCROLL_TEXT_EVENT:
+                        self.scroller.set_items(event.items)
+                    elif event.type == RADAR_FRAMES_EVENT:
+                        self.data_module.publish_radar(event.frames, event.live)
+                        self._dirty = True
                     elif event.type == pygame.MOUSEBUTTONDOWN:
                         if event.button == 3:  # Right click
                             logger.main_logger.info("Right-click menu opened")
                             self.show_context_menu()
+                            self._dirty = True
                         elif event.button == 1:  # Left click
                             # Check if clicking on a news headline
-                            if hasattr(self, 'clickable_headlines'):
-                                mouse_pos = event.pos
-                                for headline_info in self.clickable_headlines:
-                                    # Handle dict format from news_displays.py
-                                    if isinstance(headline_info, dict):
-                                        rect = headline_info.get('rect')
-                                        url = headline_info.get('url')
-                                        if rect and rect.collidepoint(mouse_pos):
-                                            logger.main_logger.info(f"Opening URL: {url}")
-                                            try:
-                                                webbrowser.open(url)
-                                            except Exception as e:
-                                                logger.main_logger.error(f"Failed to open URL: {e}")
-                                            break
-                                    else:
-                                        # Handle tuple format (legacy)
-                                        try:
-                                            rect, url = headline_info
-                                            if rect.collidepoint(mouse_pos):
-                                                logger.main_logger.info(f"Opening URL: {url}")
-                                                webbrowser.open(url)
-                                                break
-                                        except:
-                                            pass
+                            url = self._headline_url_at(event.pos)
+                            if url:
+                                logger.main_logger.info(f"Opening URL: {url}")
+                                try:
+                                    webbrowser.open(url)
+                                except Exception as e:
+                                    logger.main_logger.error(f"Failed to open URL: {e}")
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_ESCAPE:
                             logger.main_logger.info("Escape key pressed")
@@ -1291,96 +1783,54 @@ class WeatherStar4000Complete:
                         elif event.key == pygame.K_RIGHT:
                             self.cycle_display()
                         elif event.key == pygame.K_LEFT:
-                            old_mode = self.displays[self.current_display_index]
-                            self.current_display_index = (self.current_display_index - 1) % len(self.displays)
-                            new_mode = self.displays[self.current_display_index]
+                            old_mode = self._current_mode
+                            self._show_display(self.current_display_index - 1)
+                            new_mode = self._current_mode
                             logger.log_display_change(old_mode.value, new_mode.value)
                             self.display_timer = 0
+                            self._dirty = True
                         elif event.key == pygame.K_m:  # M key for menu
                             logger.main_logger.info("M key pressed - opening menu")
                             self.show_context_menu()
+                            self._dirty = True
 
                 # Auto-cycle displays
                 if self.is_playing and self.display_timer >= DISPLAY_DURATION_MS:
                     self.cycle_display()
 
-                # Update weather data every 5 minutes
-                if time.time() - last_update > 300:
-                    logger.main_logger.info("5-minute weather update")
-                    self.update_weather_data()
-                    last_update = time.time()
-
                 # Draw current display
-                current_mode = self.displays[self.current_display_index]
-
-                try:
-                    # Use modular display methods
-                    if current_mode == DisplayMode.CURRENT_CONDITIONS:
-                        if self.displays_module:
-                            self.displays_module.draw_current_conditions()
-                    elif current_mode == DisplayMode.LOCAL_FORECAST:
-                        if self.displays_module:
-                            self.displays_module.draw_local_forecast()
-                    elif current_mode == DisplayMode.EXTENDED_FORECAST:
-                        if self.displays_module:
-                            self.displays_module.draw_extended_forecast()
-                    elif current_mode == DisplayMode.HOURLY_FORECAST:
-                        if self.displays_module:
-                            self.displays_module.draw_hourly_forecast()
-                    elif current_mode == DisplayMode.REGIONAL_OBSERVATIONS:
-                        if self.displays_module:
-                            self.displays_module.draw_latest_observations()
-                    elif current_mode == DisplayMode.TRAVEL_CITIES:
-                        if self.displays_module:
-                            self.displays_module.draw_travel_cities()
-                    elif current_mode == DisplayMode.MARINE_FORECAST:
-                        if self.displays_module:
-                            self.displays_module.draw_marine_forecast()
-                    elif current_mode == DisplayMode.AIR_QUALITY:
-                        if self.displays_module:
-                            self.displays_module.draw_air_quality()
-                    elif current_mode == DisplayMode.TEMPERATURE_GRAPH:
-                        if self.displays_module:
-                            self.displays_module.draw_temperature_graph()
-                    elif current_mode == DisplayMode.WEATHER_RECORDS:
-                        if self.displays_module:
-                            self.displays_module.draw_weather_records()
-                    elif current_mode == DisplayMode.SUN_MOON:
-                        if self.displays_module:
-                            self.displays_module.draw_sun_moon()
-                    elif current_mode == DisplayMode.WIND_PRESSURE:
-                        if self.displays_module:
-                            self.displays_module.draw_wind_pressure()
-                    elif current_mode == DisplayMode.WEEKEND_FORECAST:
-                        if self.displays_module:
-                            self.displays_module.draw_weekend_forecast()
-                    elif current_mode == DisplayMode.MONTHLY_OUTLOOK:
-                        if self.displays_module:
-                            self.displays_module.draw_monthly_outlook()
-                    elif current_mode == DisplayMode.MSN_NEWS:
-                        if self.news_module:
-                            self.news_module.draw_msn_news()
-                    elif current_mode == DisplayMode.REDDIT_NEWS:
-                        if self.news_module:
-                            self.news_module.draw_reddit_news()
-                    elif current_mode == DisplayMode.LOCAL_NEWS:
-                        if self.news_module:
-                            self.news_module.draw_local_news()
-                    elif current_mode == DisplayMode.ALMANAC:
-                        if self.displays_module:
-                            self.displays_module.draw_almanac()
-                    elif current_mode == DisplayMode.HAZARDS:
-                        if self.displays_module:
-                            self.displays_module.draw_hazards()
-                    elif current_mode == DisplayMode.RADAR:
-                        if self.displays_module:
-                            self.displays_module.draw_radar()
-                    else:
-                        # Fallback
-                        self.draw_background('1')
-                        self.draw_header(current_mode.value.replace('-', ' ').title())
-                except Exception as e:
-                    logger.log_error(f"Error drawing {current_mode.value}", e)
+                self.stamp_frame_time()
+                current_mode = self._current_mode
+
+                # Static screens are only redrawn when marked dirty; in between,
+                # just the scroller band is repainted and pushed to the display
+                redraw = (self._dirty or current_mode in ANIMATED_MODES
+                          or not self._scroller_backdrop_ready)
+                # Clear before drawing so updates published mid-frame mark the next one
+                self._dirty = False
+
+                # On a static screen, a frame where the ticker hasn't moved a whole
+                # pixel would present identical pixels, so skip it entirely
+                scroller_moved = self.scroller.update()
+                if not (redraw or scroller_moved):
+                    continue
+
+                if redraw:
+                    try:
+                        # Use modular display methods
+                        draw = draw_dispatch.get(current_mode)
+                        if draw:
+                            draw()
+                        else:
+                            self._draw_fallback(current_mode)
+                    except Exception as e:
+                        logger.log_error(f"Error drawing {current_mode.value}", e)
+
+                    if current_mode not in ANIMATED_MODES:
+                        self._scroller_backdrop.blit(self.screen, (0, 0), SCROLLER_BAND)
+                        self._scroller_backdrop_ready = True
+                else:
+                    self.screen.blit(self._scroller_backdrop, SCROLLER_BAND)
 
                 # Always draw scrolling text
                 if self.displays_module:
@@ -1389,15 +1839,19 @@ class WeatherStar4000Complete:
                 # Simple display updates - no complex transitions
 
                 # Update display
-                pygame.display.flip()
+                if redraw:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(SCROLLER_BAND)
 
                 # Log performance every 1000 frames
                 if frame_count % 1000 == 0:
-                    logger.main_logger.debug(f"Frame {frame_count}, FPS: {self.clock.get_fps():.1f}")
+                    logger.main_logger.debug("Frame %d, FPS: %.1f", frame_count, self.clock.get_fps())
 
         except Exception as e:
             logger.log_error("Fatal error in main loop", e)
         finally:
+            self.api.save_cache(API_CACHE_FILE)
             logger.log_shutdown()
             pygame.quit()
 
@@ -1419,6 +1873,8 @@ def main():
     parser.add_argument('--log-level', default='DEBUG',
                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                        help='Logging level')
+    parser.add_argument('--fps', type=int, default=DEFAULT_FPS,
+                       help=f'Frame rate cap (default {DEFAULT_FPS}; raise for smoother scrolling)')
 
     args = parser.parse_args()
 
@@ -1435,7 +1891,7 @@ def main():
     logger = init_logger(log_level=log_levels[args.log_level])
 
     try:
-        ws = WeatherStar4000Complete(args.lat, args.lon)
+        ws = WeatherStar4000Complete(args.lat, args.lon, fps=args.fps)
         ws.run()
     except Exception as e:
         logger.log_error("Failed to start WeatherStar", e)
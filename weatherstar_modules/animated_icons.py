@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import time
 import logging
+from bisect import bisect_right
+from itertools import accumulate
 
 try:
     from PIL import Image
@@ -28,6 +30,7 @@ class AnimatedIcon:
         self.filepath = filepath
         self.frames = []
         self.durations = []
+        self.frame_ends = []  # Running total of durations: when each frame stops showing
         self.current_frame = 0
         self.last_update = 0
         self.total_duration = 0
@@ -87,6 +90,7 @@ class AnimatedIcon:
             gif.close()
 
             # Calculate total duration
+            self.frame_ends = list(accumulate(self.durations))
             self.total_duration = sum(self.durations)
 
             # If only one frame, treat as static
@@ -94,6 +98,7 @@ class AnimatedIcon:
                 self.static_image = self.frames[0]
                 self.frames = []
                 self.durations = []
+                self.frame_ends = []
 
             logger.info(f"Loaded animated icon: {os.path.basename(self.filepath)} ({len(self.frames)} frames)")
 
@@ -114,7 +119,7 @@ class AnimatedIcon:
             return None
 
         # Calculate which frame to show based on time
-        current_time = time.time()
+        current_time = time.monotonic()
 
         if self.last_update == 0:
             self.last_update = current_time
@@ -123,13 +128,11 @@ class AnimatedIcon:
         # Calculate elapsed time since last reset
         elapsed = current_time - self.last_update
 
-        # Find which frame we should be on
-        accumulated_time = 0
-        for i, duration in enumerate(self.durations):
-            accumulated_time += duration
-            if elapsed < accumulated_time:
-                self.current_frame = i
-                return self.frames[i]
+        # Find which frame we should be on: the first one still showing at elapsed
+        i = bisect_right(self.frame_ends, elapsed)
+        if i < len(self.frames):
+            self.current_frame = i
+            return self.frames[i]
 
         # If we've exceeded total duration, reset
         self.last_update = current_time
@@ -9,11 +9,32 @@ to reduce the main file size and improve organization.
 import requests
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import io
 import pygame
 
+# Carries decoded radar frames from the fetch thread to the main loop, which owns
+# the display and fonts and turns them into surfaces
+RADAR_FRAMES_EVENT = pygame.USEREVENT + 4
+
+# Seconds a successful radar fetch stays fresh. Kept below the 5 minute weather
+# refresh so the scheduled update always refetches, while extra calls are skipped
+RADAR_REFRESH_SECONDS = 240
+
+# NOAA RIDGE radar loop URLs per frame, newest (5) to oldest (0), each in fallback order:
+# higher resolution first, then standard resolution, then the lite version
+RADAR_FRAME_URLS = tuple(
+    (i, (
+        f"https://radar.weather.gov/ridge/standard/CONUS-LARGE_{i}.gif",
+        f"https://radar.weather.gov/ridge/standard/CONUS_{i}.gif",
+        f"https://radar.weather.gov/ridge/lite/N0R/CONUS_{i}.png",
+    ))
+    for i in range(5, -1, -1)
+)
+
 
 class WeatherStarDataFetchers:
     """Data fetching methods for WeatherStar 4000+"""
@@ -25,16 +46,26 @@ class WeatherStarDataFetchers:
         from weatherstar_modules.weatherstar_logger import get_logger
         self.logger = get_logger()
 
+        # Radar is fetched on a background thread and swapped in when complete.
+        # _radar_live is set while the frames on screen came from NOAA
+        self._radar_thread = None
+        self._radar_live = False
+        self.radar_last_fetch = None
+
+        # Shared session so repeated radar requests reuse their HTTPS connections
+        self._http_session = requests.Session()
+        self._http_session.headers['User-Agent'] = 'WeatherStar4000'
+
     def get_cached_city_name(self):
         """Get city name with caching to avoid repeated API calls"""
         # Cache for 1 hour (3600 seconds)
-        if self.ws.cached_city_name and (time.time() - self.ws.city_name_cached_at) < 3600:
+        if self.ws.cached_city_name and (time.monotonic() - self.ws.city_name_cached_at) < 3600:
             return self.ws.cached_city_name
 
         # Get fresh city name
         from weatherstar_modules import get_local_news
         self.ws.cached_city_name = get_local_news.get_city_name_from_coords(self.ws.lat, self.ws.lon)
-        self.ws.city_name_cached_at = time.time()
+        self.ws.city_name_cached_at = time.monotonic()
         self.logger.main_logger.info(f"Updated cached city name: {self.ws.cached_city_name}")
         return self.ws.cached_city_name
 
@@ -45,124 +76,173 @@ class WeatherStarDataFetchers:
         # For Reddit: Use Reddit API or PRAW library
         pass
 
+    def _radar_fresh(self):
+        """True while the last successful NOAA radar fetch is recent enough to keep showing"""
+        return (self.radar_last_fetch is not None
+                and time.monotonic() - self.radar_last_fetch < RADAR_REFRESH_SECONDS
+                and self.ws.radar_image is not None)
+
+    def start_radar_fetch(self, force=False):
+        """Fetch radar in the background; the current frames stay on screen until it finishes"""
+        if not force and self._radar_fresh():
+            self.logger.main_logger.debug("Radar still fresh, skipping fetch")
+            return False
+
+        if self._radar_thread is not None and self._radar_thread.is_alive():
+            self.logger.main_logger.debug("Radar fetch already in progress")
+            return False
+
+        self._radar_thread = threading.Thread(target=self.fetch_radar_image, daemon=True)
+        self._radar_thread.start()
+        return True
+
+    def _post_radar(self, frames, live):
+        """Hand RGB frame buffers (oldest first) to the main loop; frames=None asks for the placeholder"""
+        pygame.event.post(pygame.event.Event(RADAR_FRAMES_EVENT, frames=frames, live=live))
+
+    def publish_radar(self, frames, live):
+        """Swap a posted radar frame set into the display; runs on the main thread"""
+        if not live and self._radar_live:
+            self.logger.main_logger.info("Radar fetch failed, keeping the current frames")
+            return
+
+        if frames is None:
+            surfaces = [self._radar_placeholder()]
+        else:
+            surfaces = [pygame.image.frombytes(data, size, 'RGB').convert() for data, size in frames]
+
+        self._radar_live = live
+        self.ws.radar_frame_index = 0
+        self.ws.radar_last_update = pygame.time.get_ticks()
+        self.ws.radar_image = surfaces[-1]  # Latest frame
+        self.ws.radar_frames = surfaces
+
+    def _radar_placeholder(self):
+        """Build the radar unavailable screen"""
+        placeholder = pygame.Surface((500, 300))
+        placeholder.fill((0, 30, 60))
+
+        font = pygame.font.Font(None, 36)
+        text1 = font.render("RADAR DATA", True, (255, 255, 255))
+        text2 = font.render("TEMPORARILY UNAVAILABLE", True, (255, 255, 0))
+
+        placeholder.blit(text1, (150, 120))
+        placeholder.blit(text2, (80, 160))
+        return placeholder.convert()
+
+    def _fetch_first_image(self, urls):
+        """Try the candidate URLs in priority order and return the first usable image response"""
+        for url in urls:
+            try:
+                response = self._http_session.get(url, timeout=3)
+            except Exception as e:
+                self.logger.main_logger.debug(f"Failed to load {url}: {e}")
+                continue
+
+            if response.status_code == 200 and len(response.content) > 1000:
+                return response, url
+        return None, None
+
     def fetch_radar_image(self):
-        """Fetch REAL radar from NOAA/weather.gov with regional zoom and animation"""
+        """Fetch REAL radar from NOAA/weather.gov with regional zoom and animation.
+
+        Runs on the radar thread, so it only decodes with PIL; the frames are
+        turned into surfaces on the main thread by publish_radar.
+        """
         try:
-            import pygame
             import io
             from PIL import Image
 
             self.logger.main_logger.info(f"Fetching regional radar for lat:{self.ws.lat}, lon:{self.ws.lon}")
 
-            # Try to get animated frames
-            self.ws.radar_frames = []
+            # Try to get animated frames (built locally, published when complete)
+            frames = []
 
             # Try to get multiple frames for animation (last 5 frames)
-            for i in range(5, -1, -1):  # Get 6 frames, newest to oldest
-                radar_urls = [
-                    # Try higher resolution first
-                    f"https://radar.weather.gov/ridge/standard/CONUS-LARGE_{i}.gif",
-                    # Standard resolution fallback
-                    f"https://radar.weather.gov/ridge/standard/CONUS_{i}.gif",
-                    # Try lite version if others fail
-                    f"https://radar.weather.gov/ridge/lite/N0R/CONUS_{i}.png",
-                ]
-
-                for url in radar_urls:
-                    try:
-                        response = requests.get(url, timeout=3, headers={'User-Agent': 'WeatherStar4000'})
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                # The frames download side by side; each one falls back from the
+                # large image to the standard and lite ones only when the better one fails
+                pending = [(i, executor.submit(self._fetch_first_image, radar_urls))
+                           for i, radar_urls in RADAR_FRAME_URLS]  # Get 6 frames, newest to oldest
+                for i, future in pending:
+                    response, url = future.result()
+                    if response is None:
+                        continue
 
-                        if response.status_code == 200 and len(response.content) > 1000:
-                            # Load the image
-                            img_data = io.BytesIO(response.content)
+                    try:
+                        # Load the image
+                        img_data = io.BytesIO(response.content)
 
-                            # Use PIL to handle GIF properly
-                            pil_img = Image.open(img_data)
-                            # Convert to RGB if necessary
-                            if pil_img.mode != 'RGB':
-                                pil_img = pil_img.convert('RGB')
+                        # Use PIL to handle GIF properly
+                        pil_img = Image.open(img_data)
 
-                            # Crop to zoom in on location
-                            crop_box = self._calculate_crop_area(self.ws.lat, self.ws.lon, pil_img.size)
-                            pil_img = pil_img.crop(crop_box)
+                        # Crop to zoom in on location while still palettized (1 byte/pixel)
+                        crop_box = self._calculate_crop_area(self.ws.lat, self.ws.lon, pil_img.size)
+                        pil_img = pil_img.crop(crop_box)
 
-                            # Use high-quality resizing with PIL before converting to pygame
-                            # This gives much smoother results than pygame's scale
-                            from PIL import Image
-                            pil_img = pil_img.resize((500, 300), Image.LANCZOS)
+                        # Convert to RGB if necessary - the palette lookup now only
+                        # runs over the cropped region instead of the whole CONUS image
+                        if pil_img.mode != 'RGB':
+                            pil_img = pil_img.convert('RGB')
 
-                            # Apply slight blur to reduce pixelation
-                            from PIL import ImageFilter
-                            pil_img = pil_img.filter(ImageFilter.SMOOTH)
+                        # Use high-quality resizing with PIL before converting to pygame
+                        # This gives much smoother results than pygame's scale. reducing_gap
+                        # lets PIL shrink large crops with its integer box reduce() first, so
+                        # the float LANCZOS kernel only covers the last 2x of the downscale
+                        from PIL import Image
+                        pil_img = pil_img.resize((500, 300), Image.LANCZOS, reducing_gap=2.0)
 
-                            # Convert to pygame surface
-                            img_bytes = io.BytesIO()
-                            pil_img.save(img_bytes, 'PNG')
-                            img_bytes.seek(0)
-                            radar_img = pygame.image.load(img_bytes)
+                        # Apply slight blur to reduce pixelation
+                        from PIL import ImageFilter
+                        pil_img = pil_img.filter(ImageFilter.SMOOTH)
 
-                            self.ws.radar_frames.append(radar_img)
-                            self.logger.main_logger.debug(f"Loaded frame {i} from {url}")
-                            break
+                        # Keep the raw RGB buffer; the main thread makes the surface
+                        frames.append((pil_img.tobytes(), pil_img.size))
+                        self.logger.main_logger.debug(f"Loaded frame {i} from {url}")
 
                     except Exception as e:
-                        self.logger.main_logger.debug(f"Failed to load frame {i} from {url}: {e}")
-                        continue
+                        self.logger.main_logger.debug(f"Failed to decode frame {i} from {url}: {e}")
 
             # If we got frames, set up animation
-            if self.ws.radar_frames:
+            if frames:
                 # Reverse so oldest frame is first
-                self.ws.radar_frames.reverse()
-                self.ws.radar_image = self.ws.radar_frames[-1]  # Latest frame
-                self.ws.radar_frame_index = 0
-                self.logger.main_logger.info(f"Successfully loaded {len(self.ws.radar_frames)} radar frames")
+                frames.reverse()
+                self._post_radar(frames, live=True)
+                self.radar_last_fetch = time.monotonic()
+                self.logger.main_logger.info(f"Successfully loaded {len(frames)} radar frames")
                 return True
 
             # If no frames loaded, try static image
-            if not self.ws.radar_frames:
+            if not frames:
                 # Try static GOES satellite image
                 try:
                     # This is a free sample tile - no API key needed
                     url = "https://tile.openweathermap.org/map/precipitation_new/3/3/2.png?appid=1234567890"
-                    response = requests.get(url, timeout=3)
+                    response = self._http_session.get(url, timeout=3)
 
                     if response.status_code == 200:
                         img_data = io.BytesIO(response.content)
-                        radar_img = pygame.image.load(img_data)
+                        radar_img = Image.open(img_data).convert('RGBA')
 
                         # Create a base map
-                        base = pygame.Surface((500, 300))
-                        base.fill((0, 30, 60))
+                        base = Image.new('RGB', (500, 300), (0, 30, 60))
 
                         # Scale and center the radar tile
-                        scaled = pygame.transform.scale(radar_img, (400, 240))
-                        base.blit(scaled, (50, 30))
+                        scaled = radar_img.resize((400, 240), Image.NEAREST)
+                        base.paste(scaled, (50, 30), scaled)
 
-                        self.ws.radar_frames = [base]
-                        self.ws.radar_image = base
-                        radar_loaded = True
+                        frames = [(base.tobytes(), base.size)]
                         self.logger.main_logger.info("Loaded OpenWeatherMap radar tile")
 
                 except:
                     pass
 
-            if not radar_loaded:
-                # Last resort - just create a placeholder
+            if not frames:
+                # Last resort - the main thread draws a placeholder
                 self.logger.main_logger.warning("Could not fetch real radar, using placeholder")
+                frames = None
 
-                placeholder = pygame.Surface((500, 300))
-                placeholder.fill((0, 30, 60))
-
-                font = pygame.font.Font(None, 36)
-                text1 = font.render("RADAR DATA", True, (255, 255, 255))
-                text2 = font.render("TEMPORARILY UNAVAILABLE", True, (255, 255, 0))
-
-                placeholder.blit(text1, (150, 120))
-                placeholder.blit(text2, (80, 160))
-
-                self.ws.radar_frames = [placeholder]
-                self.ws.radar_image = placeholder
-
+            self._post_radar(frames, live=False)
             return True
 
         except Exception as e:
@@ -18,7 +18,14 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import math
 import random
+import re
 import webbrowser
+from functools import lru_cache
+from collections import OrderedDict
+
+import numpy as np
+
+from weatherstar_modules.graph_layout import compute_bars
 
 # Constants from main file
 SCREEN_WIDTH = 640
@@ -26,6 +33,15 @@ SCREEN_HEIGHT = 480
 DISPLAY_DURATION_MS = 15000
 SCROLL_SPEED = 100
 
+# Air quality health tips bounce speed in pixels/second (0.5 px per frame at the old 30 FPS)
+HEALTH_TIP_SCROLL_SPEED = 15
+
+# Maximum number of rendered text surfaces kept by WeatherStarDisplays._render
+TEXT_CACHE_SIZE = 512
+
+# Keywords that flag a forecast period as hazardous
+_HAZARD_RE = re.compile(r'storm|severe|warning|watch|advisory', re.IGNORECASE)
+
 # Colors from ws4kp SCSS
 COLORS = {
     'yellow': (255, 255, 0),           # Title color
@@ -42,6 +58,97 @@ COLORS = {
     'orange': (255, 140, 0),           # WeatherStar accent orange
 }
 
+# Static display data (simulated until real feeds are wired in)
+_TRAVEL_CITIES = (
+    ("NEW YORK", 72, "Partly Cloudy"),
+    ("LOS ANGELES", 78, "Sunny"),
+    ("CHICAGO", 65, "Cloudy"),
+    ("MIAMI", 85, "T-Storms"),
+    ("DALLAS", 88, "Mostly Sunny"),
+    ("SEATTLE", 62, "Rain"),
+    ("DENVER", 70, "Clear"),
+    ("ATLANTA", 79, "Partly Cloudy"),
+)
+
+_MARINE_CONDITIONS = (
+    ("Water Temperature", "72°F"),
+    ("Wave Height", "2-4 ft"),
+    ("Wave Period", "6 seconds"),
+    ("Rip Current Risk", "MODERATE"),
+    ("UV Index", "8 (Very High)"),
+    ("Tide", "High @ 2:30 PM"),
+    ("Wind", "E 10-15 mph"),
+    ("Visibility", "10+ miles"),
+)
+
+_AQI_SCALE = (
+    ("0-50", "Good", (0, 255, 0)),
+    ("51-100", "Moderate", COLORS['yellow']),
+    ("101-150", "Sensitive Groups", (255, 165, 0)),
+)
+
+# Temperature graph bar colors, one per graph_layout color bucket (cold to hot)
+_TEMP_BAR_COLORS = (
+    (100, 150, 255),  # Freezing - light blue
+    (150, 200, 255),  # Cold - lighter blue
+    (150, 255, 150),  # Cool - light green
+    (255, 255, 100),  # Mild - yellow
+    (255, 200, 100),  # Warm - orange
+    (255, 100, 100),  # Hot - red
+)
+
+_WEATHER_RECORDS = (
+    ("Record High", "92°F (1998)"),
+    ("Record Low", "41°F (1965)"),
+    ("Average High", "75°F"),
+    ("Average Low", "58°F"),
+    ("Record Rainfall", "3.21\" (1977)"),
+    ("Record Snowfall", "0.0\" (Never)"),
+)
+
+
+def _moon_phase_for(moon_age):
+    """Return (phase name, illumination %) for a simplified 0-29 day moon age"""
+    if moon_age < 7:
+        return "Waxing Crescent", moon_age * 14
+    elif moon_age < 14:
+        return "Waxing Gibbous", 50 + (moon_age - 7) * 7
+    elif moon_age == 14:
+        return "Full Moon", 100
+    elif moon_age < 21:
+        return "Waning Gibbous", 100 - (moon_age - 14) * 7
+    else:
+        return "Waning Crescent", 50 - (moon_age - 21) * 7
+
+
+# 16-point compass names, clockwise from north in 22.5° steps
+_WIND_DIRS = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+              'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+
+# Moon phase and illumination indexed by moon age in days
+_MOON_PHASE_TABLE = tuple(_moon_phase_for(age) for age in range(30))
+
+# Map NOAA icon conditions to our icon names
+_ICON_MAP = {
+    'skc': 'Clear', 'few': 'Clear', 'sct': 'Partly-Cloudy',
+    'bkn': 'Cloudy', 'ovc': 'Cloudy',
+    'rain': 'Rain', 'rain_showers': 'Shower',
+    'tsra': 'Thunderstorm', 'snow': 'Light-Snow',
+    'fog': 'Fog', 'wind': 'Windy'
+}
+
+
+@lru_cache(maxsize=128)
+def icon_name_for_url(icon_url):
+    """Convert NOAA icon URL to local icon name"""
+    # Example: https://api.weather.gov/icons/land/day/few?size=medium
+    # The last path segment is the condition shown, with an optional ,NN probability
+    parts = icon_url.split('/')
+    if len(parts) >= 2:
+        condition = parts[-1].split('?')[0].split(',')[0]
+        return _ICON_MAP.get(condition, 'Clear')
+    return None
+
 
 class WeatherStarDisplays:
     """Display methods for WeatherStar 4000+"""
@@ -53,14 +160,134 @@ class WeatherStarDisplays:
         from weatherstar_modules.weatherstar_logger import get_logger
         self.logger = get_logger()
 
+        # Rendered text surfaces keyed by (font id, text, color), least recently used first
+        self._text_cache = OrderedDict()
+
+        # Scaled icon frames keyed by (id of source frame, target size)
+        self._scaled_icon_cache = {}
+
+        # Word wrap results keyed by (font id, text, width) and per-font word widths
+        self._wrap_cache = {}
+        self._word_width_cache = {}
+
+        # Last (raw timestamp, formatted string) shown on Latest Observations
+        self._obs_time_cache = (None, None)
+
+        # Radar surfaces scaled to the radar box, keyed by id() of the source surface
+        self._radar_scale_cache = {}
+
+        # Temperature graph gradient bars, keyed by (color, height)
+        self._gradient_bar_cache = {}
+
+        # Dark blue band behind the scrolling text, blitted each frame
+        self._banner_bg = pygame.Surface((SCREEN_WIDTH, 30))
+        self._banner_bg.fill((0, 0, 80))
+
+        # News headline fonts as (headline, title), resolved on first use
+        self._news_fonts = None
+
+        # Radar legend overlay, built on first use once fonts are loaded
+        self._radar_legend_surf = None
+
+        # Date strings for the current day, keyed by strftime format
+        self._date_str_cache = {}
+
+        # Static text panels as (layer, screen position), built on first use once fonts are loaded
+        self._safety_tips_layer = None
+        self._marine_layer = None
+
+        # Air quality health tips auto-scroll state
+        self.health_scroll_pos = 0.0
+        self.health_scroll_dir = 1
+        self.health_scroll_time = None
+
+        self._build_air_quality_surfaces()
+        self._travel_stripes = self._build_travel_stripes()
+
+    def _render(self, font, text, color):
+        """Render antialiased text, reusing the surface from earlier frames"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is not None:
+            self._text_cache.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+        self._text_cache[key] = surface
+        if len(self._text_cache) > TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return surface
+
+    def _wrap(self, text, max_width, font=None):
+        """Greedy word wrap measuring each word once; results are cached per text and width"""
+        font = font or self.ws.font_tiny
+        key = (id(font), text, max_width)
+        lines = self._wrap_cache.get(key)
+        if lines is not None:
+            return lines
+
+        word_widths = self._word_width_cache.setdefault(id(font), {})
+        if ' ' not in word_widths:
+            word_widths[' '] = font.size(' ')[0]
+        space_width = word_widths[' ']
+
+        lines = []
+        current_line = []
+        current_width = 0
+        for word in text.split():
+            word_width = word_widths.get(word)
+            if word_width is None:
+                word_width = word_widths[word] = font.size(word)[0]
+
+            if not current_line:
+                current_line = [word]
+                current_width = word_width
+            elif current_width + space_width + word_width <= max_width:
+                current_line.append(word)
+                current_width += space_width + word_width
+            else:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                current_width = word_width
+
+        if current_line:
+            lines.append(' '.join(current_line))
+
+        # Forecast text only changes with new data, so a simple size cap is enough
+        if len(self._wrap_cache) > 256:
+            self._wrap_cache.clear()
+        if len(word_widths) > 2048:
+            word_widths.clear()
+        lines = tuple(lines)
+        self._wrap_cache[key] = lines
+        return lines
+
+    def _build_air_quality_surfaces(self):
+        """Pre-build the AQI box and pollen bar surfaces used by draw_air_quality"""
+        # AQI box outline (green for good)
+        self._aqi_box_surf = pygame.Surface((60, 40), pygame.SRCALPHA)
+        pygame.draw.rect(self._aqi_box_surf, (0, 255, 0), (0, 0, 60, 40), 2)
+
+        # One full-width bar per pollen level color, blitted cropped to the bar width
+        self._pollen_bar_surfs = {}
+        for color in ((255, 100, 100), COLORS['yellow'], (100, 255, 100)):
+            bar = pygame.Surface((80, 12))
+            bar.fill(color)
+            self._pollen_bar_surfs[color] = bar
+
+    def _build_travel_stripes(self):
+        """Pre-build the alternating row bars for draw_travel_cities as one surface"""
+        # Odd rows are 35px apart starting at y=120; each bar starts 5px above its row
+        stripes = pygame.Surface((520, 70 * (len(_TRAVEL_CITIES) // 2)), pygame.SRCALPHA).convert_alpha()
+        for i in range(len(_TRAVEL_CITIES) // 2):
+            stripes.fill((0, 0, 60, 255), (0, i * 70 + 35, 520, 30))
+        return stripes
+
     def draw_background(self, bg_name='1'):
         """Draw background image"""
-        if bg_name in self.ws.backgrounds:
-            self.ws.screen.blit(self.ws.backgrounds[bg_name], (0, 0))
-        else:
-            bg = list(self.ws.backgrounds.values())[0] if self.ws.backgrounds else None
-            if bg:
-                self.ws.screen.blit(bg, (0, 0))
+        bg = self.ws.backgrounds.get(bg_name, self.ws._default_background)
+        if bg:
+            self.ws.screen.blit(bg, (0, 0))
 
     def draw_header(self, title_top, title_bottom=None, has_noaa=False):
         """Draw standard header matching ws4kp exact layout"""
@@ -85,8 +312,7 @@ class WeatherStarDisplays:
             self.ws.screen.blit(self.ws.logos['noaa'], (356, 39))
 
         # Time at exact position: left: 415px, right-aligned within 170px width
-        time_str = datetime.now().strftime("%I:%M %p").lstrip('0')
-        time_text = self.ws.font_small.render(time_str, True, COLORS['white'])
+        time_text = self.ws.font_small.render(self.ws.frame_time_str, True, COLORS['white'])
         # Right-align within the box from 415 to 585 (415 + 170)
         time_rect = time_text.get_rect(right=585, y=44)
         self.ws.screen.blit(time_text, time_rect)
@@ -168,6 +394,18 @@ class WeatherStarDisplays:
         self._display_scrolling_headlines(headlines, "reddit")
         self.logger.main_logger.debug("Drew Reddit news display")
 
+    def _get_news_fonts(self):
+        """Resolve the headline fonts once; constructing a Font opens the font file"""
+        if self._news_fonts is None:
+            try:
+                news_font = pygame.font.Font(self.ws.font_paths.get('small'), 20)
+                title_font = pygame.font.Font(self.ws.font_paths.get('normal'), 22)
+            except:
+                news_font = pygame.font.Font(None, 20)
+                title_font = pygame.font.Font(None, 22)
+            self._news_fonts = (news_font, title_font)
+        return self._news_fonts
+
     def _display_scrolling_headlines(self, headlines, source):
         """Display news with vertical scrolling from bottom"""
         # Initialize vertical scroll position if not exists
@@ -185,12 +423,7 @@ class WeatherStarDisplays:
             self.ws.news_vertical_scroll[source] = 200  # Start 25% up the screen (was 480)
 
         # Use readable font
-        try:
-            news_font = pygame.font.Font(self.ws.font_paths.get('small'), 20)
-            title_font = pygame.font.Font(self.ws.font_paths.get('normal'), 22)
-        except:
-            news_font = pygame.font.Font(None, 20)
-            title_font = pygame.font.Font(None, 22)
+        news_font, title_font = self._get_news_fonts()
 
         # Create clipping region for scrolling area (reduced width by 30px total, height by 22px at bottom)
         clip_rect = pygame.Rect(55, 100, 530, 298)  # Was 40, 100, 560, 320 - reduced bottom by 22px total
@@ -348,7 +581,7 @@ class WeatherStarDisplays:
             self.ws.news_vertical_scroll[source] = 440  # Reset to bottom but visible
 
         # Footer with update time (outside clipping area)
-        update_time = datetime.now().strftime("%I:%M %p")
+        update_time = self.ws.frame_now.strftime("%I:%M %p")
         footer = news_font.render(f"Updated: {update_time}", True, COLORS['yellow'])
         footer_rect = footer.get_rect(center=(320, 440))
         self.ws.screen.blit(footer, footer_rect)
@@ -363,6 +596,9 @@ class WeatherStarDisplays:
             self.logger.main_logger.debug("No current data to display")
             return
 
+        # Everything below the header is collected and handed to SDL in one blits() call
+        blits = []
+
         # Main content area has 64px margins on each side (has-box class)
         # So actual content width is 640 - 128 = 512px
         # Left column is 255px, right column is 255px (with 2px gap)
@@ -375,9 +611,8 @@ class WeatherStarDisplays:
         temp_c = current.get('temperature', {}).get('value')
         if temp_c is not None:
             temp_f = int(temp_c * 9/5 + 32)
-            temp_text = self.ws.font_large.render(f"{temp_f}°", True, COLORS['white'])
-            temp_rect = temp_text.get_rect(center=(left_col_center, 140))
-            self.ws.screen.blit(temp_text, temp_rect)
+            temp_text = self._render(self.ws.font_large, f"{temp_f}°", COLORS['white'])
+            blits.append((temp_text, temp_text.get_rect(center=(left_col_center, 140))))
 
         # Weather condition (below temp)
         description = current.get('textDescription', '')
@@ -385,9 +620,8 @@ class WeatherStarDisplays:
             # Shorten if too long
             if len(description) > 15:
                 description = description[:15]
-            desc_text = self.ws.font_extended.render(description, True, COLORS['white'])
-            desc_rect = desc_text.get_rect(center=(left_col_center, 190))
-            self.ws.screen.blit(desc_text, desc_rect)
+            desc_text = self._render(self.ws.font_extended, description, COLORS['white'])
+            blits.append((desc_text, desc_text.get_rect(center=(left_col_center, 190))))
 
         # Weather icon (centered below condition) with animation support
         icon_name = self._get_icon_name(current.get('icon', ''))
@@ -395,15 +629,16 @@ class WeatherStarDisplays:
 
         # Try animated icon first
         if self.ws.icon_manager:
-            icon = self.ws.icon_manager.get_icon(icon_name, 86, 75)  # Standard icon size
+            frame = self.ws.icon_manager.get_icon(icon_name)
+            if frame:
+                icon = self._scale_icon_cached(frame, (86, 75))  # Standard icon size
 
         # Fallback to static icon
         if not icon and icon_name and icon_name in self.ws.icons:
             icon = self.ws.icons[icon_name]
 
         if icon:
-            icon_rect = icon.get_rect(center=(left_col_center, 260))
-            self.ws.screen.blit(icon, icon_rect)
+            blits.append((icon, icon.get_rect(center=(left_col_center, 260))))
 
         # Wind information with flex layout
         wind_y = 320
@@ -411,8 +646,8 @@ class WeatherStarDisplays:
         wind_dir = current.get('windDirection', {}).get('value')
 
         # Wind container - flex with 50% each side
-        wind_label = self.ws.font_extended.render("Wind:", True, COLORS['white'])
-        self.ws.screen.blit(wind_label, (content_left + 10, wind_y))  # margin-left: 10px
+        wind_label = self._render(self.ws.font_extended, "Wind:", COLORS['white'])
+        blits.append((wind_label, (content_left + 10, wind_y)))  # margin-left: 10px
 
         # Always show wind info, even if None
         if wind_speed is not None and wind_speed > 0:
@@ -426,18 +661,16 @@ class WeatherStarDisplays:
             # Show "N/A" if no wind data available
             wind_str = "N/A"
 
-        wind_text = self.ws.font_extended.render(wind_str, True, COLORS['white'])
+        wind_text = self._render(self.ws.font_extended, wind_str, COLORS['white'])
         # Right side of flex container
-        wind_rect = wind_text.get_rect(right=content_left + 245, y=wind_y)
-        self.ws.screen.blit(wind_text, wind_rect)
+        blits.append((wind_text, wind_text.get_rect(right=content_left + 245, y=wind_y)))
 
         # Wind gusts (right-aligned below wind)
         wind_gust = current.get('windGust', {}).get('value')
         if wind_gust is not None:
             gust_mph = int(wind_gust * 0.621371)
-            gust_text = self.ws.font_normal.render(f"Gusts to {gust_mph}", True, COLORS['white'])
-            gust_rect = gust_text.get_rect(right=content_left + 245, y=wind_y + 35)
-            self.ws.screen.blit(gust_text, gust_rect)
+            gust_text = self._render(self.ws.font_normal, f"Gusts to {gust_mph}", COLORS['white'])
+            blits.append((gust_text, gust_text.get_rect(right=content_left + 245, y=wind_y + 35)))
 
         # RIGHT COLUMN: starts at 64 + 257 = 321px from left edge
         right_col_x = content_left + 257  # Small gap between columns
@@ -448,8 +681,8 @@ class WeatherStarDisplays:
         y_pos = 100
         location_str = f"{self.ws.location.get('city', '')}".strip()[:20]  # Max 20 chars
         if location_str:
-            location_text = self.ws.font_normal.render(location_str, True, COLORS['yellow'])
-            self.ws.screen.blit(location_text, (right_col_x, y_pos))
+            location_text = self._render(self.ws.font_normal, location_str, COLORS['yellow'])
+            blits.append((location_text, (right_col_x, y_pos)))
             y_pos += 34  # margin-bottom: 10px + line-height: 24px
 
         # Data rows with labels and values
@@ -535,16 +768,17 @@ class WeatherStarDisplays:
         # margin-bottom: 12px between rows, line-height: 24px
         for label, value in row_data:
             # Label with margin-left: 20px
-            label_text = self.ws.font_normal.render(label, True, COLORS['white'])
-            self.ws.screen.blit(label_text, (label_x, y_pos))
+            label_text = self._render(self.ws.font_normal, label, COLORS['white'])
+            blits.append((label_text, (label_x, y_pos)))
 
             # Value right-aligned with margin-right: 10px
-            value_text = self.ws.font_normal.render(value, True, COLORS['white'])
-            value_rect = value_text.get_rect(right=value_x, y=y_pos)
-            self.ws.screen.blit(value_text, value_rect)
+            value_text = self._render(self.ws.font_normal, value, COLORS['white'])
+            blits.append((value_text, value_text.get_rect(right=value_x, y=y_pos)))
 
             y_pos += 36  # line-height: 24px + margin-bottom: 12px
 
+        self.ws.screen.blits(blits, doreturn=0)
+
     def draw_local_forecast(self):
         """Draw Local Forecast screen with 3-day forecast layout"""
         self.draw_background('2')
@@ -714,7 +948,7 @@ class WeatherStarDisplays:
                 else:
                     new_w, new_h = 86, 75  # Default size
 
-                icon = pygame.transform.scale(original_icon, (new_w, new_h))
+                icon = self._scale_icon_cached(original_icon, (new_w, new_h))
                 icon_rect = icon.get_rect(center=(col_center, 180))
                 self.ws.screen.blit(icon, icon_rect)
 
@@ -784,33 +1018,14 @@ class WeatherStarDisplays:
         """Convert NOAA icon URL to local icon name"""
         if not icon_url:
             return None
-
-        # Extract icon name from URL
-        # Example: https://api.weather.gov/icons/land/day/few?size=medium
-        parts = icon_url.split('/')
-        if len(parts) >= 2:
-            condition = parts[-1].split('?')[0]
-
-            # Map NOAA conditions to our icon names
-            icon_map = {
-                'skc': 'Clear', 'few': 'Clear', 'sct': 'Partly-Cloudy',
-                'bkn': 'Cloudy', 'ovc': 'Cloudy',
-                'rain': 'Rain', 'rain_showers': 'Shower',
-                'tsra': 'Thunderstorm', 'snow': 'Light-Snow',
-                'fog': 'Fog', 'wind': 'Windy'
-            }
-
-            return icon_map.get(condition, 'Clear')
-        return None
+        return icon_name_for_url(icon_url)
 
     def _get_wind_direction(self, degrees):
         """Convert degrees to cardinal direction"""
         if degrees is None:
             return ''
-        directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-                     'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
         index = int((degrees + 11.25) / 22.5) % 16
-        return directions[index]
+        return _WIND_DIRS[index]
 
     def draw_hourly_forecast(self):
         """Draw Hourly Forecast screen with actual hourly data and scrolling"""
@@ -818,12 +1033,14 @@ class WeatherStarDisplays:
         self.ws.draw_header("Hourly", "Forecast")
 
         # Get hourly forecast data
-        hourly = self.ws.weather_data.get('hourly', {})
+        # Snapshot once so a background refresh can't swap data mid-draw
+        weather_data = self.ws.weather_data
+        hourly = weather_data.get('hourly', {})
         periods = hourly.get('periods', [])
 
         if not periods:
             # Fallback to regular forecast if no hourly data
-            forecast = self.ws.weather_data.get('forecast', {})
+            forecast = weather_data.get('forecast', {})
             periods = forecast.get('periods', [])
 
         # Create continuous scrolling effect
@@ -858,7 +1075,7 @@ class WeatherStarDisplays:
                 y_pos = base_y + y_offset + (i * line_height)
 
                 # Only draw if visible in the clipping area
-                if y_pos >= content_top and y_pos <= content_top + content_height + 50:
+                if clip_rect.top - line_height < y_pos < clip_rect.bottom:
                     # Parse time from period name or startTime
                     if 'startTime' in period:
                         try:
@@ -925,42 +1142,49 @@ class WeatherStarDisplays:
         # Observation time
         timestamp = current.get('timestamp')
         if timestamp:
-            try:
-                from datetime import datetime
-                obs_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                time_str = obs_time.strftime("%I:%M %p %m/%d").lstrip('0')
+            time_str = self._format_obs_time(timestamp)
+            if time_str:
                 time_text = self.ws.font_normal.render(f"Observed: {time_str}", True, COLORS['white'])
                 self.ws.screen.blit(time_text, (60, y_pos))
-            except:
-                pass
+
+    def _format_date(self, fmt):
+        """Format today's date, re-running strftime only when the day changes"""
+        now = self.ws.frame_now
+        today = now.date()
+        cached = self._date_str_cache.get(fmt)
+        if cached is None or cached[0] != today:
+            cached = (today, now.strftime(fmt))
+            self._date_str_cache[fmt] = cached
+        return cached[1]
+
+    def _format_obs_time(self, timestamp):
+        """Format an observation timestamp, reusing the last result until it changes"""
+        cached_ts, cached_str = self._obs_time_cache
+        if timestamp == cached_ts:
+            return cached_str
+
+        try:
+            obs_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            time_str = obs_time.strftime("%I:%M %p %m/%d").lstrip('0')
+        except:
+            time_str = None
+
+        self._obs_time_cache = (timestamp, time_str)
+        return time_str
 
     def draw_travel_cities(self):
         """Draw Travel Cities weather - major US cities"""
         self.ws.draw_background('5')  # Use a cleaner background
         self.ws.draw_header("Travel Cities", "Weather")
 
-        # Major US cities with weather data
-        cities = [
-            ("NEW YORK", 72, "Partly Cloudy"),
-            ("LOS ANGELES", 78, "Sunny"),
-            ("CHICAGO", 65, "Cloudy"),
-            ("MIAMI", 85, "T-Storms"),
-            ("DALLAS", 88, "Mostly Sunny"),
-            ("SEATTLE", 62, "Rain"),
-            ("DENVER", 70, "Clear"),
-            ("ATLANTA", 79, "Partly Cloudy")
-        ]
-
         # Simple clean layout
         y_pos = 120
 
-        for i, (city, temp, conditions) in enumerate(cities):
-            # Alternate row colors for readability (subtle)
-            if i % 2 == 1:
-                # Draw subtle background bar
-                bar_rect = pygame.Rect(60, y_pos - 5, 520, 30)
-                pygame.draw.rect(self.ws.screen, (0, 0, 60), bar_rect)
+        # Alternate row colors for readability (subtle background bars)
+        self.ws.screen.blit(self._travel_stripes, (60, y_pos - 5))
 
+        # Major US cities with weather data
+        for city, temp, conditions in _TRAVEL_CITIES:
             # City name (yellow, left aligned)
             city_text = self.ws.font_normal.render(city, True, COLORS['yellow'])
             self.ws.screen.blit(city_text, (80, y_pos))
@@ -989,34 +1213,32 @@ class WeatherStarDisplays:
         # Radar display area
         radar_rect = pygame.Rect(70, 100, 500, 300)
 
-        # Display animated radar if available
-        if hasattr(self.ws, 'radar_frames') and self.ws.radar_frames:
+        # Display animated radar if available (snapshot: the fetch thread may swap the list)
+        radar_frames = self.ws.radar_frames
+        if radar_frames:
             # Animate through frames
             current_time = pygame.time.get_ticks()
 
             # Change frame every 500ms for smooth animation
-            if not hasattr(self.ws, 'radar_last_update'):
-                self.ws.radar_last_update = current_time
-                self.ws.radar_frame_index = 0
-
             if current_time - self.ws.radar_last_update > 500:
-                self.ws.radar_frame_index = (self.ws.radar_frame_index + 1) % len(self.ws.radar_frames)
+                self.ws.radar_frame_index = (self.ws.radar_frame_index + 1) % len(radar_frames)
                 self.ws.radar_last_update = current_time
 
             # Display current frame
-            frame = self.ws.radar_frames[self.ws.radar_frame_index]
-            scaled_frame = pygame.transform.scale(frame, (500, 300))
+            frame_index = self.ws.radar_frame_index % len(radar_frames)
+            frame = radar_frames[frame_index]
+            scaled_frame = self._get_scaled_radar(frame, radar_rect.size)
 
             # Blit normally without special blending
             self.ws.screen.blit(scaled_frame, radar_rect)
 
             # Show frame indicator
-            frame_text = self.ws.font_tiny.render(f"Frame {self.ws.radar_frame_index + 1}/{len(self.ws.radar_frames)}", True, COLORS['white'])
+            frame_text = self._render(self.ws.font_tiny, f"Frame {frame_index + 1}/{len(radar_frames)}", COLORS['white'])
             self.ws.screen.blit(frame_text, (radar_rect.right - 80, radar_rect.bottom - 20))
 
-        elif hasattr(self.ws, 'radar_image') and self.ws.radar_image:
+        elif self.ws.radar_image:
             # Static radar image
-            scaled_img = pygame.transform.scale(self.ws.radar_image, (500, 300))
+            scaled_img = self._get_scaled_radar(self.ws.radar_image, radar_rect.size)
 
             # Blit normally without special blending
             self.ws.screen.blit(scaled_img, radar_rect)
@@ -1037,17 +1259,35 @@ class WeatherStarDisplays:
 
         # Location and timestamp
         location = f"{self.ws.location.get('city', '')}, {self.ws.location.get('state', '')}"
-        loc_text = self.ws.font_normal.render(location.upper(), True, COLORS['yellow'])
+        loc_text = self._render(self.ws.font_normal, location.upper(), COLORS['yellow'])
         loc_rect = loc_text.get_rect(center=(320, 420))
         self.ws.screen.blit(loc_text, loc_rect)
 
         # RainViewer attribution (small, authentic style)
-        attr_text = self.ws.font_tiny.render("Radar by RainViewer", True, COLORS['white'])
+        attr_text = self._render(self.ws.font_tiny, "Radar by RainViewer", COLORS['white'])
         self.ws.screen.blit(attr_text, (radar_rect.left, radar_rect.bottom + 5))
 
         # Legend - draw on top layer
         self._draw_radar_legend(radar_rect)
 
+    def _get_scaled_radar(self, surface, size):
+        """Return a radar surface scaled to size, rescaling only when the source changes"""
+        if surface.get_size() == size:
+            return surface
+
+        cached = self._radar_scale_cache.get(id(surface))
+        # Keep the source alive alongside the scaled copy so its id() is not reused
+        if cached and cached[0] is surface and cached[1].get_size() == size:
+            return cached[1]
+
+        # Drop frames from previous radar fetches
+        if len(self._radar_scale_cache) > 16:
+            self._radar_scale_cache.clear()
+
+        scaled = pygame.transform.scale(surface, size)
+        self._radar_scale_cache[id(surface)] = (surface, scaled)
+        return scaled
+
     def _draw_us_map_outline(self, radar_rect):
         """Draw simple US map outline on radar"""
         # Scale coordinates to fit radar rect
@@ -1080,9 +1320,15 @@ class WeatherStarDisplays:
 
     def _draw_radar_legend(self, radar_rect):
         """Draw radar intensity legend"""
-        legend_y = radar_rect.top + 10
-        legend_x = radar_rect.left + 10
+        if self._radar_legend_surf is None:
+            self._radar_legend_surf = self._build_radar_legend()
 
+        self.ws.screen.blit(self._radar_legend_surf, (radar_rect.left + 10, radar_rect.top + 10))
+
+        self.logger.main_logger.debug("Drew Radar display")
+
+    def _build_radar_legend(self):
+        """Render the static radar intensity legend onto one transparent surface"""
         # Rain intensity legend (simple colored boxes)
         intensities = [
             ((0, 100, 0), "Light"),
@@ -1091,17 +1337,21 @@ class WeatherStarDisplays:
             ((255, 0, 0), "Intense")
         ]
 
-        for i, (color, label) in enumerate(intensities):
+        labels = [self.ws.font_tiny.render(label, True, COLORS['white']) for _, label in intensities]
+        width = 20 + max(label.get_width() for label in labels)
+        height = max(15, labels[-1].get_height()) + 20 * (len(intensities) - 1)
+        legend = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+
+        for i, ((color, _), label_text) in enumerate(zip(intensities, labels)):
             # Color box
-            box_rect = pygame.Rect(legend_x, legend_y + (i * 20), 15, 15)
-            pygame.draw.rect(self.ws.screen, color, box_rect)
-            pygame.draw.rect(self.ws.screen, COLORS['white'], box_rect, 1)
+            box_rect = pygame.Rect(0, i * 20, 15, 15)
+            pygame.draw.rect(legend, color, box_rect)
+            pygame.draw.rect(legend, COLORS['white'], box_rect, 1)
 
             # Label
-            label_text = self.ws.font_tiny.render(label, True, COLORS['white'])
-            self.ws.screen.blit(label_text, (legend_x + 20, legend_y + (i * 20)))
+            legend.blit(label_text, (20, i * 20))
 
-        self.logger.main_logger.debug("Drew Radar display")
+        return legend
 
     def draw_almanac(self):
         """Draw Almanac screen with weather statistics and records"""
@@ -1111,9 +1361,7 @@ class WeatherStarDisplays:
         current = self.ws.weather_data.get('current', {})
 
         # Get current date/time
-        from datetime import datetime
-        now = datetime.now()
-        date_str = now.strftime("%B %d, %Y")
+        date_str = self._format_date("%B %d, %Y")
 
         # Title
         date_text = self.ws.font_normal.render(f"Weather Statistics for {date_str}", True, COLORS['yellow'])
@@ -1209,8 +1457,7 @@ class WeatherStarDisplays:
         has_alerts = False
 
         for period in periods[:3]:
-            forecast_text = period.get('detailedForecast', '').lower()
-            if any(word in forecast_text for word in ['storm', 'severe', 'warning', 'watch', 'advisory']):
+            if _HAZARD_RE.search(period.get('detailedForecast', '')):
                 has_alerts = True
                 # Display the alert
                 name = period.get('name', '')
@@ -1241,28 +1488,11 @@ class WeatherStarDisplays:
                     y_pos += 35
 
         if not has_alerts:
-            # No alerts
-            no_alert = self.ws.font_normal.render("No active weather alerts at this time", True, COLORS['white'])
-            no_alert_rect = no_alert.get_rect(center=(320, 200))
-            self.ws.screen.blit(no_alert, no_alert_rect)
-
-            # Safety tips
-            y_pos = 250
-            tips_title = self.ws.font_extended.render("WEATHER SAFETY TIPS", True, COLORS['yellow'])
-            self.ws.screen.blit(tips_title, (60, y_pos))
-            y_pos += 35
-
-            tips = [
-                "• Monitor weather conditions regularly",
-                "• Have an emergency kit prepared",
-                "• Know your evacuation routes",
-                "• Sign up for weather alerts"
-            ]
-
-            for tip in tips:
-                tip_text = self.ws.font_normal.render(tip, True, COLORS['white'])
-                self.ws.screen.blit(tip_text, (80, y_pos))
-                y_pos += 25
+            # No alerts - the message and safety tips never change
+            if self._safety_tips_layer is None:
+                self._safety_tips_layer = self._build_safety_tips_layer()
+            layer, pos = self._safety_tips_layer
+            self.ws.screen.blit(layer, pos)
 
         self.logger.main_logger.debug("Drew Hazards display")
 
@@ -1271,38 +1501,75 @@ class WeatherStarDisplays:
         self.ws.draw_background('3')  # Use background 3 for marine
         self.ws.draw_header("Marine", "Forecast")
 
+        # Simulated marine data never changes, so it is composed once
+        if self._marine_layer is None:
+            self._marine_layer = self._build_marine_layer()
+        layer, pos = self._marine_layer
+        self.ws.screen.blit(layer, pos)
+
+        self.logger.main_logger.debug("Drew Marine Forecast display")
+
+    def _compose_static(self, blits):
+        """Pre-blit (surface, screen rect or position) pairs onto one transparent layer
+
+        Returns (layer, screen position) so the panel costs a single blit per frame.
+        """
+        rects = [pygame.Rect(dest) if len(dest) == 4 else surf.get_rect(topleft=dest)
+                 for surf, dest in blits]
+        bounds = rects[0].unionall(rects[1:])
+        layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for (surf, _), rect in zip(blits, rects):
+            layer.blit(surf, rect.move(-bounds.x, -bounds.y))
+        return layer.convert_alpha(), bounds.topleft
+
+    def _build_safety_tips_layer(self):
+        """Render the no-alerts message and weather safety tips"""
+        no_alert = self.ws.font_normal.render("No active weather alerts at this time", True, COLORS['white'])
+        blits = [(no_alert, no_alert.get_rect(center=(320, 200)))]
+
+        # Safety tips
+        y_pos = 250
+        tips_title = self.ws.font_extended.render("WEATHER SAFETY TIPS", True, COLORS['yellow'])
+        blits.append((tips_title, (60, y_pos)))
+        y_pos += 35
+
+        tips = [
+            "• Monitor weather conditions regularly",
+            "• Have an emergency kit prepared",
+            "• Know your evacuation routes",
+            "• Sign up for weather alerts"
+        ]
+
+        for tip in tips:
+            tip_text = self.ws.font_normal.render(tip, True, COLORS['white'])
+            blits.append((tip_text, (80, y_pos)))
+            y_pos += 25
+
+        return self._compose_static(blits)
+
+    def _build_marine_layer(self):
+        """Render the coastal conditions table"""
         y_pos = 120
 
         # Beach/Marine conditions
         title = self.ws.font_extended.render("COASTAL CONDITIONS", True, COLORS['yellow'])
-        self.ws.screen.blit(title, (60, y_pos))
+        blits = [(title, (60, y_pos))]
         y_pos += 35
 
         # Simulated marine data (would fetch from NOAA marine API in production)
-        conditions = [
-            ("Water Temperature", "72°F"),
-            ("Wave Height", "2-4 ft"),
-            ("Wave Period", "6 seconds"),
-            ("Rip Current Risk", "MODERATE"),
-            ("UV Index", "8 (Very High)"),
-            ("Tide", "High @ 2:30 PM"),
-            ("Wind", "E 10-15 mph"),
-            ("Visibility", "10+ miles")
-        ]
-
-        for label, value in conditions:
+        for label, value in _MARINE_CONDITIONS:
             # Label
             label_text = self.ws.font_normal.render(f"{label}:", True, COLORS['white'])
-            self.ws.screen.blit(label_text, (80, y_pos))
+            blits.append((label_text, (80, y_pos)))
 
             # Value (color based on severity)
             color = COLORS['yellow'] if "MODERATE" in value or "High" in value else COLORS['white']
             value_text = self.ws.font_normal.render(value, True, color)
-            self.ws.screen.blit(value_text, (300, y_pos))
+            blits.append((value_text, (300, y_pos)))
 
             y_pos += 28
 
-        self.logger.main_logger.debug("Drew Marine Forecast display")
+        return self._compose_static(blits)
 
     def draw_air_quality(self):
         """Draw Air Quality & Health"""
@@ -1325,7 +1592,7 @@ class WeatherStarDisplays:
         aqi_color = (0, 255, 0)  # Green for good
 
         # Draw AQI box
-        pygame.draw.rect(self.ws.screen, aqi_color, (left_x, y_pos, 60, 40), 2)
+        self.ws.screen.blit(self._aqi_box_surf, (left_x, y_pos))
         aqi_num = self.ws.font_normal.render(str(aqi_value), True, aqi_color)
         num_rect = aqi_num.get_rect(center=(left_x + 30, y_pos + 20))
         self.ws.screen.blit(aqi_num, num_rect)
@@ -1335,13 +1602,7 @@ class WeatherStarDisplays:
         y_pos += 50
 
         # AQI scale reference
-        scale = [
-            ("0-50", "Good", (0, 255, 0)),
-            ("51-100", "Moderate", COLORS['yellow']),
-            ("101-150", "Sensitive Groups", (255, 165, 0))
-        ]
-
-        for range_txt, desc, color in scale:
+        for range_txt, desc, color in _AQI_SCALE:
             text = self.ws.font_small.render(f"{range_txt}: {desc}", True, color)
             self.ws.screen.blit(text, (left_x, y_pos))
             y_pos += 22
@@ -1375,7 +1636,8 @@ class WeatherStarDisplays:
             # Align bars properly - fixed position for all bars
             bar_x = right_x + 70  # Fixed starting position
             bar_width = 80 if level == "HIGH" else 60 if level == "MODERATE" else 40
-            pygame.draw.rect(self.ws.screen, color, (bar_x, pollen_y + 2, bar_width, 12))
+            self.ws.screen.blit(self._pollen_bar_surfs[color], (bar_x, pollen_y + 2),
+                                (0, 0, bar_width, 12))
 
             # Position level text after the bar
             level_text = self.ws.font_tiny.render(level, True, color)
@@ -1400,25 +1662,22 @@ class WeatherStarDisplays:
         clip_rect = pygame.Rect(60, y_pos, 520, 440 - y_pos)  # Leave some margin at bottom
         self.ws.screen.set_clip(clip_rect)
 
-        # Initialize scroll position if not exists
-        if not hasattr(self.ws, 'health_scroll_pos'):
-            self.ws.health_scroll_pos = 0
-            self.ws.health_scroll_dir = 1
-
         # Auto-scroll if text is too long
         total_height = len(tips) * 22
         if total_height > (440 - y_pos):
-            # Update scroll position
-            self.ws.health_scroll_pos += self.ws.health_scroll_dir * 0.5
-            if self.ws.health_scroll_pos > 0:
-                self.ws.health_scroll_pos = 0
-                self.ws.health_scroll_dir = -1
-            elif self.ws.health_scroll_pos < -(total_height - (440 - y_pos)):
-                self.ws.health_scroll_pos = -(total_height - (440 - y_pos))
-                self.ws.health_scroll_dir = 1
+            # Update scroll position by elapsed time, bouncing between the top and bottom limits
+            # (dt is capped so returning to the screen doesn't jump the tips to an end)
+            now = time.monotonic()
+            dt = min(now - self.health_scroll_time, 0.25) if self.health_scroll_time is not None else 0.0
+            self.health_scroll_time = now
+            scroll_min = -(total_height - (440 - y_pos))
+            self.health_scroll_pos += self.health_scroll_dir * HEALTH_TIP_SCROLL_SPEED * dt
+            if not (scroll_min <= self.health_scroll_pos <= 0):
+                self.health_scroll_dir = -self.health_scroll_dir
+                self.health_scroll_pos = max(scroll_min, min(0.0, self.health_scroll_pos))
 
         # Draw tips with scroll offset
-        tip_y = y_pos + self.ws.health_scroll_pos if hasattr(self.ws, 'health_scroll_pos') else y_pos
+        tip_y = y_pos + self.health_scroll_pos
         for tip in tips:
             # Use smaller font and proper wrapping
             if self.ws.font_tiny.size(tip)[0] > 500:
@@ -1439,12 +1698,12 @@ class WeatherStarDisplays:
 
                 # Draw wrapped lines
                 for line in lines:
-                    if 0 < tip_y < 440:  # Only draw visible lines
+                    if clip_rect.top - 20 < tip_y < clip_rect.bottom:  # Only render lines inside the clip
                         tip_text = self.ws.font_tiny.render(f"• {line}", True, COLORS['white'])
                         self.ws.screen.blit(tip_text, (70, tip_y))
                     tip_y += 20
             else:
-                if 0 < tip_y < 440:  # Only draw visible lines
+                if clip_rect.top - 22 < tip_y < clip_rect.bottom:  # Only render lines inside the clip
                     tip_text = self.ws.font_tiny.render(f"• {tip}", True, COLORS['white'])
                     self.ws.screen.blit(tip_text, (70, tip_y))
                 tip_y += 22
@@ -1500,49 +1759,17 @@ class WeatherStarDisplays:
             max_temp = max(all_temps) + 5
             temp_range = max_temp - min_temp
 
-            # Draw bars
+            # Lay out bars (x, high/low pixel rows, color bucket from blue/cold to red/hot)
             bar_width = graph_width // len(temps)
-            for i, ((high, low), label) in enumerate(zip(temps, labels)):
-                x = graph_left + i * bar_width + bar_width // 2
-
-                # Calculate heights
-                high_y = graph_top + graph_height - ((high - min_temp) / temp_range * graph_height)
-                low_y = graph_top + graph_height - ((low - min_temp) / temp_range * graph_height)
-
+            bars = compute_bars(temps, graph_left, bar_width, graph_top, graph_height,
+                                min_temp, temp_range)
+            for (high, low), label, (x, high_y, low_y, bucket) in zip(temps, labels, bars):
                 # Draw temperature bar with color gradient
                 bar_x = x - 20
-                bar_height = abs(low_y - high_y)
-
-                # Calculate color based on average temperature
-                avg_temp = (high + low) / 2
-                # Color gradient from blue (cold) to red (hot)
-                if avg_temp < 32:  # Freezing
-                    bar_color = (100, 150, 255)  # Light blue
-                elif avg_temp < 50:  # Cold
-                    bar_color = (150, 200, 255)  # Lighter blue
-                elif avg_temp < 65:  # Cool
-                    bar_color = (150, 255, 150)  # Light green
-                elif avg_temp < 75:  # Mild
-                    bar_color = (255, 255, 100)  # Yellow
-                elif avg_temp < 85:  # Warm
-                    bar_color = (255, 200, 100)  # Orange
-                else:  # Hot
-                    bar_color = (255, 100, 100)  # Red
-
-                # Draw gradient bar
-                # Draw multiple rectangles with slightly different colors for gradient effect
-                gradient_steps = 5
-                step_height = bar_height / gradient_steps
-                for j in range(gradient_steps):
-                    # Interpolate color
-                    factor = j / gradient_steps
-                    r = int(bar_color[0] * (1 - factor * 0.3))  # Darken towards bottom
-                    g = int(bar_color[1] * (1 - factor * 0.3))
-                    b = int(bar_color[2] * (1 - factor * 0.3))
-                    step_color = (min(255, r), min(255, g), min(255, b))
-
-                    pygame.draw.rect(self.ws.screen, step_color,
-                                   (bar_x, high_y + j * step_height, 40, step_height + 1))
+                bar_top = int(high_y)
+                bar_height = int(high_y + abs(low_y - high_y)) + 1 - bar_top
+                gradient_bar = self._get_gradient_bar(_TEMP_BAR_COLORS[bucket], bar_height)
+                self.ws.screen.blit(gradient_bar, (bar_x, bar_top))
 
                 # Draw temperatures
                 high_text = self.ws.font_small.render(str(high), True, COLORS['yellow'])
@@ -1560,14 +1787,32 @@ class WeatherStarDisplays:
 
         self.logger.main_logger.debug("Drew Temperature Graph display")
 
+    def _get_gradient_bar(self, bar_color, height):
+        """Return a 40px wide bar of bar_color darkening towards the bottom"""
+        key = (bar_color, height)
+        bar = self._gradient_bar_cache.get(key)
+        if bar is not None:
+            return bar
+
+        bar = pygame.Surface((40, height))
+        # Darken towards the bottom (by up to 24%) in one vectorized pass
+        t = np.linspace(0, 0.24, height, dtype=np.float32)[:, None]
+        rgb = (np.array(bar_color, np.float32) * (1 - t)).clip(0, 255).astype(np.uint8)
+        arr = np.broadcast_to(rgb[:, None, :], (height, 40, 3))
+        pygame.surfarray.blit_array(bar, arr.swapaxes(0, 1))
+
+        # Bar heights only change with new forecast data
+        if len(self._gradient_bar_cache) > 32:
+            self._gradient_bar_cache.clear()
+        self._gradient_bar_cache[key] = bar
+        return bar
+
     def draw_weather_records(self):
         """Draw Weather Records"""
         self.ws.draw_background('4')
         self.ws.draw_header("Weather", "Records")
 
-        from datetime import datetime
-        now = datetime.now()
-        date_str = now.strftime("%B %d")
+        date_str = self._format_date("%B %d")
 
         y_pos = 120
 
@@ -1578,16 +1823,7 @@ class WeatherStarDisplays:
         y_pos += 40
 
         # Simulated record data (would fetch from historical database)
-        records = [
-            ("Record High", f"92°F (1998)"),
-            ("Record Low", f"41°F (1965)"),
-            ("Average High", f"75°F"),
-            ("Average Low", f"58°F"),
-            ("Record Rainfall", f"3.21\" (1977)"),
-            ("Record Snowfall", f"0.0\" (Never)"),
-        ]
-
-        for label, value in records:
+        for label, value in _WEATHER_RECORDS:
             label_text = self.ws.font_normal.render(f"{label}:", True, COLORS['white'])
             self.ws.screen.blit(label_text, (120, y_pos))
 
@@ -1613,19 +1849,20 @@ class WeatherStarDisplays:
         self.ws.draw_background('1')  # Use background 1 (standard 2-column)
         self.ws.draw_header("Sun & Moon", "Data")
 
+        white = COLORS['white']
+        yellow = COLORS['yellow']
         # Two column layout - moved closer together
         left_col_x = 60
         right_col_x = 335  # Moved 15px to the left to close gap
         y_pos = 120
 
         # LEFT COLUMN - Sun data
-        sun_title = self.ws.font_normal.render("SUN", True, COLORS['yellow'])
+        sun_title = self._render(self.ws.font_normal, "SUN", yellow)
         self.ws.screen.blit(sun_title, (left_col_x, y_pos))
         sun_y = y_pos + 30
 
         # Calculate approximate sunrise/sunset (simplified)
-        from datetime import datetime
-        now = datetime.now()
+        now = self.ws.frame_now
         sunrise = now.replace(hour=6, minute=45, second=0)
         sunset = now.replace(hour=19, minute=30, second=0)
         day_length = sunset - sunrise
@@ -1642,41 +1879,31 @@ class WeatherStarDisplays:
             ("UV Index", "6 (High)")
         ]
 
+        # Collect the rows and hand them to SDL in one blits() call
+        row_blits = []
         for label, value in sun_data:
             # Use tiny font for better fit
-            label_text = self.ws.font_tiny.render(f"{label}:", True, COLORS['white'])
-            self.ws.screen.blit(label_text, (left_col_x + 10, sun_y))
+            label_text = self._render(self.ws.font_tiny, f"{label}:", white)
+            row_blits.append((label_text, (left_col_x + 10, sun_y)))
 
             # Calculate proper position for value to avoid overlap - 5px thinner
-            label_width = self.ws.font_tiny.size(f"{label}:")[0]
+            label_width = label_text.get_width()
             value_x = left_col_x + 15 + max(110, label_width + 10)  # Reduced from 120 to 110
-            value_text = self.ws.font_tiny.render(value, True, COLORS['yellow'])
-            self.ws.screen.blit(value_text, (value_x, sun_y))
+            value_text = self._render(self.ws.font_tiny, value, yellow)
+            row_blits.append((value_text, (value_x, sun_y)))
 
             sun_y += 24  # Reduced spacing
 
+        self.ws.screen.blits(row_blits, doreturn=0)
+
         # RIGHT COLUMN - Moon data
-        moon_title = self.ws.font_normal.render("MOON", True, COLORS['yellow'])
+        moon_title = self._render(self.ws.font_normal, "MOON", yellow)
         self.ws.screen.blit(moon_title, (right_col_x, y_pos))
         moon_y = y_pos + 30
 
         # Calculate moon phase (simplified)
         moon_age = (now.day % 30)  # Very simplified
-        if moon_age < 7:
-            phase = "Waxing Crescent"
-            illumination = moon_age * 14
-        elif moon_age < 14:
-            phase = "Waxing Gibbous"
-            illumination = 50 + (moon_age - 7) * 7
-        elif moon_age == 14:
-            phase = "Full Moon"
-            illumination = 100
-        elif moon_age < 21:
-            phase = "Waning Gibbous"
-            illumination = 100 - (moon_age - 14) * 7
-        else:
-            phase = "Waning Crescent"
-            illumination = 50 - (moon_age - 21) * 7
+        phase, illumination = _MOON_PHASE_TABLE[moon_age]
 
         moon_data = [
             ("Phase", phase),
@@ -1688,19 +1915,22 @@ class WeatherStarDisplays:
             ("Age", f"{moon_age} days")
         ]
 
+        row_blits = []
         for label, value in moon_data:
             # Use tiny font for better fit
-            label_text = self.ws.font_tiny.render(f"{label}:", True, COLORS['white'])
-            self.ws.screen.blit(label_text, (right_col_x + 10, moon_y))
+            label_text = self._render(self.ws.font_tiny, f"{label}:", white)
+            row_blits.append((label_text, (right_col_x + 10, moon_y)))
 
             # Calculate proper position for value to avoid overlap - 5px thinner
-            label_width = self.ws.font_tiny.size(f"{label}:")[0]
+            label_width = label_text.get_width()
             value_x = right_col_x + 15 + max(100, label_width + 10)  # Reduced from 110 to 100
-            value_text = self.ws.font_tiny.render(value, True, COLORS['yellow'])
-            self.ws.screen.blit(value_text, (value_x, moon_y))
+            value_text = self._render(self.ws.font_tiny, value, yellow)
+            row_blits.append((value_text, (value_x, moon_y)))
 
             moon_y += 24  # Reduced spacing
 
+        self.ws.screen.blits(row_blits, doreturn=0)
+
         self.logger.main_logger.debug("Drew Sun & Moon display")
 
     def draw_wind_pressure(self):
@@ -1708,69 +1938,68 @@ class WeatherStarDisplays:
         self.ws.draw_background('1')
         self.ws.draw_header("Wind &", "Pressure")
 
-        current = self.ws.weather_data.get('current', {})
+        get = self.ws.weather_data.get('current', {}).get
+
+        # Pull every value and do the unit conversions up front
+        wind_speed = get('windSpeed', {}).get('value')
+        wind_dir = get('windDirection', {}).get('value')
+        wind_gust = get('windGust', {}).get('value')
+        wind_chill = get('windChill', {}).get('value')
+        heat_index = get('heatIndex', {}).get('value')
+        pressure = get('barometricPressure', {}).get('value')
 
+        font_normal = self.ws.font_normal
+        font_extended = self.ws.font_extended
+        white = COLORS['white']
+        yellow = COLORS['yellow']
+
+        # Collect the rows and hand them to SDL in one blits() call
+        row_blits = []
         y_pos = 120
 
         # Wind section
-        wind_title = self.ws.font_extended.render("WIND CONDITIONS", True, COLORS['yellow'])
-        self.ws.screen.blit(wind_title, (60, y_pos))
+        row_blits.append((self._render(font_extended, "WIND CONDITIONS", yellow), (60, y_pos)))
         y_pos += 35
 
-        # Get wind data
-        wind_speed = current.get('windSpeed', {}).get('value')
-        wind_dir = current.get('windDirection', {}).get('value')
-        wind_gust = current.get('windGust', {}).get('value')
-
         if wind_speed:
             wind_mph = int(wind_speed * 0.621371)
-            speed_text = self.ws.font_normal.render(f"Speed: {wind_mph} mph", True, COLORS['white'])
-            self.ws.screen.blit(speed_text, (80, y_pos))
+            row_blits.append((self._render(font_normal, f"Speed: {wind_mph} mph", white), (80, y_pos)))
             y_pos += 30
 
         if wind_dir:
             dir_text = self._get_wind_direction(wind_dir)
-            direction = self.ws.font_normal.render(f"Direction: {dir_text} ({wind_dir}°)", True, COLORS['white'])
-            self.ws.screen.blit(direction, (80, y_pos))
+            row_blits.append((self._render(font_normal, f"Direction: {dir_text} ({wind_dir}°)", white), (80, y_pos)))
             y_pos += 30
 
         if wind_gust:
             gust_mph = int(wind_gust * 0.621371)
-            gust_text = self.ws.font_normal.render(f"Gusts: {gust_mph} mph", True, COLORS['yellow'])
-            self.ws.screen.blit(gust_text, (80, y_pos))
+            row_blits.append((self._render(font_normal, f"Gusts: {gust_mph} mph", yellow), (80, y_pos)))
             y_pos += 30
 
         # Wind chill / Heat index
-        wind_chill = current.get('windChill', {}).get('value')
-        heat_index = current.get('heatIndex', {}).get('value')
-
         if wind_chill:
             wc_f = int(wind_chill * 9/5 + 32)
-            wc_text = self.ws.font_normal.render(f"Wind Chill: {wc_f}°F", True, COLORS['blue'])
-            self.ws.screen.blit(wc_text, (80, y_pos))
+            row_blits.append((self._render(font_normal, f"Wind Chill: {wc_f}°F", COLORS['blue']), (80, y_pos)))
             y_pos += 30
         elif heat_index:
             hi_f = int(heat_index * 9/5 + 32)
-            hi_text = self.ws.font_normal.render(f"Heat Index: {hi_f}°F", True, (255, 100, 100))
-            self.ws.screen.blit(hi_text, (80, y_pos))
+            row_blits.append((self._render(font_normal, f"Heat Index: {hi_f}°F", (255, 100, 100)), (80, y_pos)))
             y_pos += 30
 
         # Pressure section
         y_pos += 20
-        pressure_title = self.ws.font_extended.render("BAROMETRIC PRESSURE", True, COLORS['yellow'])
-        self.ws.screen.blit(pressure_title, (60, y_pos))
+        row_blits.append((self._render(font_extended, "BAROMETRIC PRESSURE", yellow), (60, y_pos)))
         y_pos += 35
 
-        pressure = current.get('barometricPressure', {}).get('value')
         if pressure:
             pressure_inhg = pressure * 0.00029530
-            press_text = self.ws.font_normal.render(f"Current: {pressure_inhg:.2f} in", True, COLORS['white'])
-            self.ws.screen.blit(press_text, (80, y_pos))
+            row_blits.append((self._render(font_normal, f"Current: {pressure_inhg:.2f} in", white), (80, y_pos)))
             y_pos += 30
 
             # Trend (simulated)
-            trend_text = self.ws.font_normal.render("Trend: Steady", True, COLORS['white'])
-            self.ws.screen.blit(trend_text, (80, y_pos))
+            row_blits.append((self._render(font_normal, "Trend: Steady", white), (80, y_pos)))
+
+        self.ws.screen.blits(row_blits, doreturn=0)
 
         self.logger.main_logger.debug("Drew Wind & Pressure display")
 
@@ -1802,194 +2031,146 @@ class WeatherStarDisplays:
             if len(saturday_periods) >= 2 and len(sunday_periods) >= 2:
                 break
 
-        # Draw Saturday column
+        # Draw Saturday and Sunday columns
         if saturday_periods:
-            y_pos = 145  # Moved down 25px from 120 to fit better
-            # Saturday header
-            sat_title = self.ws.font_extended.render("SATURDAY", True, COLORS['yellow'])
-            sat_rect = sat_title.get_rect(center=(left_col_x + col_width // 2, y_pos))
-            self.ws.screen.blit(sat_title, sat_rect)
-            y_pos += 35
+            self._draw_forecast_column(left_col_x, "SATURDAY", saturday_periods, col_width)
 
-            for period in saturday_periods[:2]:  # Day and Night
-                # Period name (DAY/NIGHT)
-                name = period.get('name', '')
-                time_of_day = "DAY" if "Day" in name or not "Night" in name else "NIGHT"
-                tod_text = self.ws.font_normal.render(time_of_day, True, COLORS['cyan'])
-                self.ws.screen.blit(tod_text, (left_col_x + 10, y_pos))
-                y_pos += 25
+        if sunday_periods:
+            self._draw_forecast_column(right_col_x, "SUNDAY", sunday_periods, col_width)
 
-                # Temperature
-                temp = period.get('temperature')
-                if temp:
-                    temp_text = self.ws.font_normal.render(f"{temp}°", True, COLORS['white'])
-                    self.ws.screen.blit(temp_text, (left_col_x + 10, y_pos))
-                    y_pos += 25
-
-                # Weather icon (if available) - properly scaled maintaining aspect ratio
-                icon_name = self._get_icon_name(period.get('icon', ''))
-                if self.ws.icon_manager:
-                    # Get icon without forcing size, then scale proportionally
-                    orig_icon = self.ws.icon_manager.get_icon(icon_name)
-                    if orig_icon:
-                        # Scale to fit in 60x60 box while maintaining aspect ratio
-                        orig_size = orig_icon.get_size()
-                        scale_factor = min(60/orig_size[0], 60/orig_size[1])
-                        new_size = (int(orig_size[0] * scale_factor), int(orig_size[1] * scale_factor))
-                        icon = pygame.transform.scale(orig_icon, new_size)
-                        # Center icon in 60x60 area
-                        icon_x = left_col_x + 70 + (60 - new_size[0]) // 2
-                        icon_y = y_pos - 50 + (60 - new_size[1]) // 2
-                        self.ws.screen.blit(icon, (icon_x, icon_y))
-
-                # Short forecast with word wrap
-                short = period.get('shortForecast', '')
-                words = short.split()
-                lines = []
-                current_line = ""
+        if not saturday_periods and not sunday_periods:
+            # No weekend data
+            msg = self.ws.font_normal.render("Weekend forecast not available", True, COLORS['white'])
+            msg_rect = msg.get_rect(center=(320, 240))
+            self.ws.screen.blit(msg, msg_rect)
 
-                for word in words:
-                    test_line = f"{current_line} {word}".strip()
-                    if self.ws.font_tiny.size(test_line)[0] <= col_width - 20:
-                        current_line = test_line
-                    else:
-                        if current_line:
-                            lines.append(current_line)
-                        current_line = word
+        self.logger.main_logger.debug("Drew Weekend Forecast display")
 
-                if current_line:
-                    lines.append(current_line)
+    def _draw_forecast_column(self, col_x, title, periods, col_width):
+        """Draw one weekend forecast column: day header, then temperature, icon and forecast per period"""
+        white = COLORS['white']
+        yellow = COLORS['yellow']
+        cyan = COLORS['cyan']
+        y_pos = 145  # Moved down 25px from 120 to fit better
+        # Day header
+        title_text = self.ws.font_extended.render(title, True, yellow)
+        title_rect = title_text.get_rect(center=(col_x + col_width // 2, y_pos))
+        self.ws.screen.blit(title_text, title_rect)
+        y_pos += 35
 
-                # Draw forecast text
-                for line in lines[:3]:  # Max 3 lines
-                    text = self.ws.font_tiny.render(line, True, COLORS['white'])
-                    self.ws.screen.blit(text, (left_col_x + 10, y_pos))
-                    y_pos += 18
+        # Collect the column and hand it to SDL in one blits() call
+        column_blits = []
+        for period in periods[:2]:  # Day and Night
+            # Period name (DAY/NIGHT)
+            name = period.get('name', '')
+            time_of_day = "DAY" if "Day" in name or not "Night" in name else "NIGHT"
+            tod_text = self.ws.font_normal.render(time_of_day, True, cyan)
+            column_blits.append((tod_text, (col_x + 10, y_pos)))
+            y_pos += 25
 
-                y_pos += 15  # Space between day/night
+            # Temperature
+            temp = period.get('temperature')
+            if temp:
+                temp_text = self.ws.font_normal.render(f"{temp}°", True, white)
+                column_blits.append((temp_text, (col_x + 10, y_pos)))
+                y_pos += 25
 
-        # Draw Sunday column
-        if sunday_periods:
-            y_pos = 145  # Moved down 25px from 120 to fit better
-            # Sunday header
-            sun_title = self.ws.font_extended.render("SUNDAY", True, COLORS['yellow'])
-            sun_rect = sun_title.get_rect(center=(right_col_x + col_width // 2, y_pos))
-            self.ws.screen.blit(sun_title, sun_rect)
-            y_pos += 35
+            # Weather icon (if available), centered in a 60x60 area
+            icon = self._resolve_and_scale_icon(self._get_icon_name(period.get('icon', '')))
+            if icon:
+                icon_width, icon_height = icon.get_size()
+                icon_x = col_x + 70 + (60 - icon_width) // 2
+                icon_y = y_pos - 50 + (60 - icon_height) // 2
+                column_blits.append((icon, (icon_x, icon_y)))
 
-            for period in sunday_periods[:2]:  # Day and Night
-                # Period name (DAY/NIGHT)
-                name = period.get('name', '')
-                time_of_day = "DAY" if "Day" in name or not "Night" in name else "NIGHT"
-                tod_text = self.ws.font_normal.render(time_of_day, True, COLORS['cyan'])
-                self.ws.screen.blit(tod_text, (right_col_x + 10, y_pos))
-                y_pos += 25
+            # Short forecast with word wrap
+            lines = self._wrap(period.get('shortForecast', ''), col_width - 20)
 
-                # Temperature
-                temp = period.get('temperature')
-                if temp:
-                    temp_text = self.ws.font_normal.render(f"{temp}°", True, COLORS['white'])
-                    self.ws.screen.blit(temp_text, (right_col_x + 10, y_pos))
-                    y_pos += 25
-
-                # Weather icon (if available) - properly scaled maintaining aspect ratio
-                icon_name = self._get_icon_name(period.get('icon', ''))
-                if self.ws.icon_manager:
-                    # Get icon without forcing size, then scale proportionally
-                    orig_icon = self.ws.icon_manager.get_icon(icon_name)
-                    if orig_icon:
-                        # Scale to fit in 60x60 box while maintaining aspect ratio
-                        orig_size = orig_icon.get_size()
-                        scale_factor = min(60/orig_size[0], 60/orig_size[1])
-                        new_size = (int(orig_size[0] * scale_factor), int(orig_size[1] * scale_factor))
-                        icon = pygame.transform.scale(orig_icon, new_size)
-                        # Center icon in 60x60 area
-                        icon_x = right_col_x + 70 + (60 - new_size[0]) // 2
-                        icon_y = y_pos - 50 + (60 - new_size[1]) // 2
-                        self.ws.screen.blit(icon, (icon_x, icon_y))
-
-                # Short forecast with word wrap
-                short = period.get('shortForecast', '')
-                words = short.split()
-                lines = []
-                current_line = ""
+            # Draw forecast text
+            for line in lines[:3]:  # Max 3 lines
+                text = self.ws.font_tiny.render(line, True, white)
+                column_blits.append((text, (col_x + 10, y_pos)))
+                y_pos += 18
 
-                for word in words:
-                    test_line = f"{current_line} {word}".strip()
-                    if self.ws.font_tiny.size(test_line)[0] <= col_width - 20:
-                        current_line = test_line
-                    else:
-                        if current_line:
-                            lines.append(current_line)
-                        current_line = word
+            y_pos += 15  # Space between day/night
 
-                if current_line:
-                    lines.append(current_line)
+        self.ws.screen.blits(column_blits, doreturn=0)
 
-                # Draw forecast text
-                for line in lines[:3]:  # Max 3 lines
-                    text = self.ws.font_tiny.render(line, True, COLORS['white'])
-                    self.ws.screen.blit(text, (right_col_x + 10, y_pos))
-                    y_pos += 18
+    def _resolve_and_scale_icon(self, icon_name, max_side=60):
+        """Return the current frame of an icon scaled to fit a max_side box, keeping aspect ratio"""
+        if not self.ws.icon_manager:
+            return None
 
-                y_pos += 15  # Space between day/night
+        orig_icon = self.ws.icon_manager.get_icon(icon_name)
+        if not orig_icon:
+            return None
 
-        if not saturday_periods and not sunday_periods:
-            # No weekend data
-            msg = self.ws.font_normal.render("Weekend forecast not available", True, COLORS['white'])
-            msg_rect = msg.get_rect(center=(320, 240))
-            self.ws.screen.blit(msg, msg_rect)
+        orig_size = orig_icon.get_size()
+        scale_factor = min(max_side / orig_size[0], max_side / orig_size[1])
+        new_size = (int(orig_size[0] * scale_factor), int(orig_size[1] * scale_factor))
+        return self._scale_icon_cached(orig_icon, new_size)
 
-        self.logger.main_logger.debug("Drew Weekend Forecast display")
+    def _scale_icon_cached(self, frame, size):
+        """Scale an icon frame, reusing the result from earlier frames"""
+        # Key on the frame surface itself so animated icons keep animating
+        key = (id(frame), size)
+        cached = self._scaled_icon_cache.get(key)
+        if cached and cached[0] is frame:
+            return cached[1]
+
+        icon = pygame.transform.scale(frame, size)
+        # Keep the source alive alongside the scaled copy so its id() is not reused
+        self._scaled_icon_cache[key] = (frame, icon)
+        return icon
 
     def draw_monthly_outlook(self):
         """Draw Monthly Outlook"""
         self.ws.draw_background('4')  # Changed to hourly forecast background
         self.ws.draw_header("30-Day", "Outlook")
 
+        white = COLORS['white']
+        yellow = COLORS['yellow']
         y_pos = 120
 
         # Title
-        from datetime import datetime
-        now = datetime.now()
-        month = now.strftime("%B %Y")
-        title = self.ws.font_normal.render(f"Outlook for {month}", True, COLORS['yellow'])
+        month = self._format_date("%B %Y")
+        title = self._render(self.ws.font_normal, f"Outlook for {month}", yellow)
         title_rect = title.get_rect(center=(320, y_pos))
         self.ws.screen.blit(title, title_rect)
         y_pos += 35  # Moved up 15px (was 50, now 35)
 
         # Temperature outlook
-        temp_title = self.ws.font_extended.render("TEMPERATURE OUTLOOK", True, COLORS['yellow'])
+        temp_title = self._render(self.ws.font_extended, "TEMPERATURE OUTLOOK", yellow)
         self.ws.screen.blit(temp_title, (60, y_pos))
         y_pos += 35
 
         temp_outlook = "Above Normal Temperatures Expected"
-        temp_text = self.ws.font_normal.render(temp_outlook, True, COLORS['white'])
+        temp_text = self._render(self.ws.font_normal, temp_outlook, white)
         self.ws.screen.blit(temp_text, (80, y_pos))
         y_pos += 30
 
         # Show probability
-        prob_text = self.ws.font_small.render("Probability: 60% above normal", True, COLORS['white'])
+        prob_text = self._render(self.ws.font_small, "Probability: 60% above normal", white)
         self.ws.screen.blit(prob_text, (100, y_pos))
         y_pos += 40
 
         # Precipitation outlook
-        precip_title = self.ws.font_extended.render("PRECIPITATION OUTLOOK", True, COLORS['yellow'])
+        precip_title = self._render(self.ws.font_extended, "PRECIPITATION OUTLOOK", yellow)
         self.ws.screen.blit(precip_title, (60, y_pos))
         y_pos += 35
 
         precip_outlook = "Near Normal Precipitation Expected"
-        precip_text = self.ws.font_normal.render(precip_outlook, True, COLORS['white'])
+        precip_text = self._render(self.ws.font_normal, precip_outlook, white)
         self.ws.screen.blit(precip_text, (80, y_pos))
         y_pos += 30
 
         # Show probability
-        prob2_text = self.ws.font_small.render("Probability: Equal chances", True, COLORS['white'])
+        prob2_text = self._render(self.ws.font_small, "Probability: Equal chances", white)
         self.ws.screen.blit(prob2_text, (100, y_pos))
         y_pos += 40
 
         # Data source
-        source = self.ws.font_small.render("Source: NOAA Climate Prediction Center", True, COLORS['white'])
+        source = self._render(self.ws.font_small, "Source: NOAA Climate Prediction Center", white)
         source_rect = source.get_rect(center=(320, 380))
         self.ws.screen.blit(source, source_rect)
 
@@ -1999,25 +2180,21 @@ class WeatherStarDisplays:
         """Draw bottom scrolling text"""
         try:
             # Banner positioned 20px from bottom (480 - 30 - 20 = 430)
-            banner_height = 30
+            banner_height = self._banner_bg.get_height()
             banner_y = SCREEN_HEIGHT - banner_height - 20  # 430px (20px from bottom)
-            pygame.draw.rect(self.ws.screen, (0, 0, 80), (0, banner_y, SCREEN_WIDTH, banner_height))  # Banner position
+            self.ws.screen.blit(self._banner_bg, (0, banner_y))  # Banner position
 
             # Check if scroller exists and is properly initialized
+            # The main loop advances the scroller (update()) before drawing the frame
             if hasattr(self.ws, 'scroller') and self.ws.scroller:
-                self.ws.scroller.update()
                 # Center text vertically in the banner
                 # Assuming font height is about 16-20px, center it properly
                 text_y = banner_y + (banner_height // 2) - 10  # Vertically centered in banner
                 self.ws.scroller.draw(self.ws.screen, text_y)
-                self.logger.main_logger.debug("Drew scrolling text successfully")
             else:
                 # Fallback if scroller not available
                 fallback_text = "Weather conditions and forecast information"
-                if hasattr(self.ws, 'font_scroller'):
-                    text_surface = self.ws.font_scroller.render(fallback_text, True, (255, 255, 255))
-                else:
-                    text_surface = self.ws.font_normal.render(fallback_text, True, (255, 255, 255))
+                text_surface = self._render(self.ws.font_scroller, fallback_text, (255, 255, 255))
                 # Center text both horizontally and vertically in the banner
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, banner_y + banner_height // 2))
                 self.ws.screen.blit(text_surface, text_rect)
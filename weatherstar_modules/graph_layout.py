@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Temperature Graph Layout Module for WeatherStar 4000
+Computes bar geometry for the temperature graph
+"""
+
+from typing import List, Tuple
+
+# Average temperature thresholds (°F) separating the bar color buckets
+TEMP_BUCKET_LIMITS = (32, 50, 65, 75, 85)
+
+
+def _bucket_for(avg_temp: float) -> int:
+    """Return the color bucket index for an average temperature"""
+    for bucket, limit in enumerate(TEMP_BUCKET_LIMITS):
+        if avg_temp < limit:
+            return bucket
+    return len(TEMP_BUCKET_LIMITS)
+
+
+def compute_bars(temps, graph_left, bar_width, graph_top, graph_height,
+                 min_temp, temp_range) -> List[Tuple[int, float, float, int]]:
+    """Lay out (high, low) pairs as (x, high_y, low_y, color bucket) tuples"""
+    bars = []
+    bottom = graph_top + graph_height
+    for i, (high, low) in enumerate(temps):
+        x = graph_left + i * bar_width + bar_width // 2
+        high_y = bottom - ((high - min_temp) / temp_range * graph_height)
+        low_y = bottom - ((low - min_temp) / temp_range * graph_height)
+        bars.append((x, high_y, low_y, _bucket_for((high + low) / 2)))
+    return bars
@@ -69,12 +69,12 @@ class WeatherStarNewsDisplays:
     def get_cached_city_name(self):
         """Get city name with caching to avoid repeated API calls"""
         # Cache for 1 hour (3600 seconds)
-        if self.ws.cached_city_name and (time.time() - self.ws.city_name_cached_at) < 3600:
+        if self.ws.cached_city_name and (time.monotonic() - self.ws.city_name_cached_at) < 3600:
             return self.ws.cached_city_name
 
         # Get fresh city name
         self.ws.cached_city_name = get_local_news.get_city_name_from_coords(self.ws.lat, self.ws.lon)
-        self.ws.city_name_cached_at = time.time()
+        self.ws.city_name_cached_at = time.monotonic()
         self.logger.main_logger.info(f"Updated cached city name: {self.ws.cached_city_name}")
         return self.ws.cached_city_name
 
@@ -253,16 +253,13 @@ class WeatherStarNewsDisplays:
 
                 # Store clickable area with URL
                 if url:
-                    self.ws.clickable_headlines.append({
-                        'rect': pygame.Rect(left_margin, current_y, display_width, line_height),
-                        'url': url,
-                        'text': headline
-                    })
+                    self.ws.clickable_headlines.append(
+                        (pygame.Rect(left_margin, current_y, display_width, line_height), url))
 
             current_y += line_height
 
         # Auto-scroll logic
-        current_time = time.time()
+        current_time = time.monotonic()
         if not hasattr(self.ws, 'last_news_scroll_time'):
             self.ws.last_news_scroll_time = current_time
 
@@ -324,23 +321,18 @@ class WeatherStarNewsDisplays:
                     text = text[:max_chars-3] + "..."
 
                 # Render text using smaller font for better fit
-                font_to_use = self.ws.font_tiny if hasattr(self.ws, 'font_tiny') else self.ws.font_normal
-                text_surface = font_to_use.render(text, True, text_color)
+                text_surface = self.ws.font_tiny.render(text, True, text_color)
                 text_rect = pygame.Rect(left_margin, current_y, display_width, line_height)
                 self.ws.screen.blit(text_surface, text_rect)
 
                 # Track clickable area if URL exists
                 if url and current_y >= start_y and current_y < start_y + max_visible_height:
-                    self.ws.clickable_headlines.append({
-                        'rect': text_rect,
-                        'url': url,
-                        'text': text
-                    })
+                    self.ws.clickable_headlines.append((text_rect, url))
 
             current_y += line_height
 
         # Auto-scroll logic
-        current_time = time.time()
+        current_time = time.monotonic()
         if not hasattr(self.ws, 'last_news_scroll_time'):
             self.ws.last_news_scroll_time = current_time
 